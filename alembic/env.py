@@ -8,6 +8,8 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# Make migration_helpers importable from version scripts
+sys.path.insert(0, os.path.dirname(__file__))
 
 from app.core.database import Base, get_database_url
 from app.model import *
@@ -0,0 +1,39 @@
+"""
+Shared existence-check helpers for migration scripts.
+
+This module only lands on sys.path when env.py runs, but commands like
+`alembic history`/`heads` load version files without executing env.py —
+so version files must import these helpers inside upgrade()/downgrade(),
+never at module level.
+
+All probes go straight to pg_catalog (single catalog lookups) rather than the
+permission-filtered information_schema views.
+"""
+from sqlalchemy import text
+
+
+def table_exists(conn, table: str) -> bool:
+    r = conn.execute(text("SELECT to_regclass(:t)"), {"t": table})
+    return r.scalar() is not None
+
+
+def column_exists(conn, table: str, column: str) -> bool:
+    r = conn.execute(
+        text(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_catalog.pg_attribute a "
+            "JOIN pg_catalog.pg_class c ON c.oid = a.attrelid "
+            "WHERE c.relname = :t AND a.attname = :c "
+            "AND a.attnum > 0 AND NOT a.attisdropped)"
+        ),
+        {"t": table, "c": column},
+    )
+    return bool(r.scalar())
+
+
+def constraint_exists(conn, name: str) -> bool:
+    r = conn.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_catalog.pg_constraint WHERE conname = :n)"),
+        {"n": name},
+    )
+    return bool(r.scalar())
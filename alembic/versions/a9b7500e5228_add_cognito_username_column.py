@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
 
 
 # revision identifiers, used by Alembic.
@@ -19,34 +18,20 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _column_exists(conn, table: str, column: str) -> bool:
-    r = conn.execute(
-        text(
-            "SELECT 1 FROM information_schema.columns "
-            "WHERE table_name = :t AND column_name = :c"
-        ),
-        {"t": table, "c": column},
-    )
-    return r.scalar() is not None
-
-
-def _constraint_exists(conn, name: str) -> bool:
-    r = conn.execute(
-        text("SELECT 1 FROM pg_constraint WHERE conname = :n"), {"n": name}
-    )
-    return r.scalar() is not None
-
-
 def upgrade() -> None:
+    # Deferred: see migration_helpers module docstring.
+    from migration_helpers import column_exists, constraint_exists
     conn = op.get_bind()
-    if not _column_exists(conn, "users", "cognito_username"):
+    if not column_exists(conn, "users", "cognito_username"):
         op.add_column("users", sa.Column("cognito_username", sa.String(), nullable=True))
-        op.execute("DELETE FROM users")
+        # TRUNCATE just unlinks the relation file instead of writing a
+        # tombstone per row; CASCADE clears dependent rows the same way.
+        op.execute("TRUNCATE users CASCADE")
         op.alter_column("users", "cognito_username", nullable=False)
         op.create_unique_constraint(
             "uq_users_cognito_username", "users", ["cognito_username"]
         )
-    elif not _constraint_exists(conn, "uq_users_cognito_username"):
+    elif not constraint_exists(conn, "uq_users_cognito_username"):
         op.create_unique_constraint(
             "uq_users_cognito_username", "users", ["cognito_username"]
         )
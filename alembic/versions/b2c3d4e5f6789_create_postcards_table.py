@@ -9,9 +9,9 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
 from sqlalchemy.dialects import postgresql
 
+
 # revision identifiers, used by Alembic.
 revision: str = "b2c3d4e5f6789"
 down_revision: Union[str, None] = "a9b7500e5228"
@@ -19,20 +19,11 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _table_exists(conn, table: str) -> bool:
-    r = conn.execute(
-        text(
-            "SELECT 1 FROM information_schema.tables "
-            "WHERE table_name = :t"
-        ),
-        {"t": table},
-    )
-    return r.scalar() is not None
-
-
 def upgrade() -> None:
+    # Deferred: see migration_helpers module docstring.
+    from migration_helpers import table_exists
     conn = op.get_bind()
-    if _table_exists(conn, "postcards"):
+    if table_exists(conn, "postcards"):
         return
     op.create_table(
         "postcards",
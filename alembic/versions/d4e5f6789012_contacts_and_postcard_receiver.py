@@ -12,6 +12,7 @@ import sqlalchemy as sa
 from sqlalchemy import text
 from sqlalchemy.dialects import postgresql
 
+
 revision: str = "d4e5f6789012"
 down_revision: Union[str, None] = "b2c3d4e5f6789"
 branch_labels: Union[str, Sequence[str], None] = None
@@ -20,30 +21,13 @@ depends_on: Union[str, Sequence[str], None] = None
 SEED_USER_ID = "df8e2c7d-0225-4ac0-b9c9-65cf422860f3"
 
 
-def _table_exists(conn, table: str) -> bool:
-    r = conn.execute(
-        text("SELECT 1 FROM information_schema.tables WHERE table_name = :t"),
-        {"t": table},
-    )
-    return r.scalar() is not None
-
-
-def _column_exists(conn, table: str, column: str) -> bool:
-    r = conn.execute(
-        text(
-            "SELECT 1 FROM information_schema.columns "
-            "WHERE table_name = :t AND column_name = :c"
-        ),
-        {"t": table, "c": column},
-    )
-    return r.scalar() is not None
-
-
 def upgrade() -> None:
+    # Deferred: see migration_helpers module docstring.
+    from migration_helpers import column_exists, table_exists
     conn = op.get_bind()
 
     # Create contacts table
-    if not _table_exists(conn, "contacts"):
+    if not table_exists(conn, "contacts"):
         op.create_table(
             "contacts",
             sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
@@ -55,8 +39,17 @@ def upgrade() -> None:
         op.create_index(op.f("ix_contacts_user_id"), "contacts", ["user_id"], unique=False)
         op.create_index(op.f("ix_contacts_email"), "contacts", ["email"], unique=False)
 
+    # (user_id, email) uniqueness from day one: later seed migrations rely on
+    # ON CONFLICT (user_id, email) instead of SELECT-then-INSERT probes.
+    # Only fresh chains execute this retrofit — databases that already
+    # recorded this revision get the index from s01234567890, which is the
+    # authoritative creation site (it also deduplicates first).
+    conn.execute(
+        text("CREATE UNIQUE INDEX IF NOT EXISTS uq_contacts_user_email ON contacts (user_id, email)")
+    )
+
     # Add receiver_contact_id to postcards
-    if not _column_exists(conn, "postcards", "receiver_contact_id"):
+    if not column_exists(conn, "postcards", "receiver_contact_id"):
         op.add_column(
             "postcards",
             sa.Column(
@@ -81,15 +74,15 @@ def upgrade() -> None:
         )
 
     # Seed contacts for user df8e2c7d-0225-4ac0-b9c9-65cf422860f3 (only if user exists and no contacts yet)
-    if _table_exists(conn, "contacts"):
-        user_exists = conn.execute(
-            text("SELECT 1 FROM users WHERE id = :uid LIMIT 1"),
+    if table_exists(conn, "contacts"):
+        user_exists = bool(conn.execute(
+            text("SELECT EXISTS (SELECT 1 FROM users WHERE id = :uid)"),
             {"uid": SEED_USER_ID},
-        ).scalar() is not None
-        already_seeded = conn.execute(
-            text("SELECT 1 FROM contacts WHERE user_id = :uid LIMIT 1"),
+        ).scalar())
+        already_seeded = bool(conn.execute(
+            text("SELECT EXISTS (SELECT 1 FROM contacts WHERE user_id = :uid)"),
             {"uid": SEED_USER_ID},
-        ).scalar() is not None
+        ).scalar())
         if user_exists and not already_seeded:
             conn.execute(
                 text("""
@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
 
 
 revision: str = "e5f678901234"
@@ -18,20 +17,11 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _column_exists(conn, table: str, column: str) -> bool:
-    r = conn.execute(
-        text(
-            "SELECT 1 FROM information_schema.columns "
-            "WHERE table_name = :t AND column_name = :c"
-        ),
-        {"t": table, "c": column},
-    )
-    return r.scalar() is not None
-
-
 def upgrade() -> None:
+    # Deferred: see migration_helpers module docstring.
+    from migration_helpers import column_exists
     conn = op.get_bind()
-    if not _column_exists(conn, "users", "profile_image_url"):
+    if not column_exists(conn, "users", "profile_image_url"):
         op.add_column("users", sa.Column("profile_image_url", sa.String(), nullable=True))
 
 
@@ -9,32 +9,21 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import text
 from sqlalchemy.dialects import postgresql
 
+
 revision: str = "f67890123456"
 down_revision: Union[str, None] = "e5f678901234"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _table_exists(conn, table: str) -> bool:
-    r = conn.execute(text("SELECT 1 FROM information_schema.tables WHERE table_name = :t"), {"t": table})
-    return r.scalar() is not None
-
-
-def _column_exists(conn, table: str, column: str) -> bool:
-    r = conn.execute(
-        text("SELECT 1 FROM information_schema.columns WHERE table_name = :t AND column_name = :c"),
-        {"t": table, "c": column},
-    )
-    return r.scalar() is not None
-
-
 def upgrade() -> None:
+    # Deferred: see migration_helpers module docstring.
+    from migration_helpers import table_exists
     conn = op.get_bind()
 
-    if not _table_exists(conn, "mailings"):
+    if not table_exists(conn, "mailings"):
         op.create_table(
             "mailings",
             sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
@@ -56,9 +45,15 @@ def upgrade() -> None:
         op.create_index(op.f("ix_mailings_contact_id"), "mailings", ["contact_id"], unique=False)
         op.create_index(op.f("ix_mailings_external_id"), "mailings", ["external_id"], unique=False)
 
-    for col in ("name", "address_line1", "city", "state", "postal_code", "country"):
-        if not _column_exists(conn, "contacts", col):
-            op.add_column("contacts", sa.Column(col, sa.String(), nullable=True))
+    # One ALTER takes the AccessExclusiveLock on contacts once instead of six
+    # times; IF NOT EXISTS replaces the per-column catalog probes.
+    op.execute(
+        "ALTER TABLE contacts "
+        + ", ".join(
+            f"ADD COLUMN IF NOT EXISTS {col} varchar"
+            for col in ("name", "address_line1", "city", "state", "postal_code", "country")
+        )
+    )
 
 
 def downgrade() -> None:
@@ -67,5 +62,10 @@ def downgrade() -> None:
     op.drop_index(op.f("ix_mailings_user_id"), table_name="mailings")
     op.drop_index(op.f("ix_mailings_postcard_id"), table_name="mailings")
     op.drop_table("mailings")
-    for col in ("name", "address_line1", "city", "state", "postal_code", "country"):
-        op.drop_column("contacts", col)
+    op.execute(
+        "ALTER TABLE contacts "
+        + ", ".join(
+            f"DROP COLUMN IF EXISTS {col}"
+            for col in ("name", "address_line1", "city", "state", "postal_code", "country")
+        )
+    )
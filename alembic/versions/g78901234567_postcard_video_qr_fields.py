@@ -8,9 +8,6 @@ Create Date: 2026-02-13
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
-from sqlalchemy import text
-
 
 revision: str = "g78901234567"
 down_revision: Union[str, None] = "a78901234567"
@@ -18,28 +15,20 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _column_exists(conn, table: str, column: str) -> bool:
-    r = conn.execute(
-        text("SELECT 1 FROM information_schema.columns WHERE table_name = :t AND column_name = :c"),
-        {"t": table, "c": column},
-    )
-    return r.scalar() is not None
+_VIDEO_COLUMNS = ("video_s3_url", "video_thumbnail_path", "video_qr_image_path")
 
 
 def upgrade() -> None:
-    conn = op.get_bind()
-    for col_name, col_type in [
-        ("video_s3_url", sa.String()),
-        ("video_thumbnail_path", sa.String()),
-        ("video_qr_image_path", sa.String()),
-    ]:
-        if not _column_exists(conn, "postcards", col_name):
-            op.add_column("postcards", sa.Column(col_name, col_type, nullable=True))
+    # One ALTER takes the AccessExclusiveLock on postcards once; IF NOT EXISTS
+    # replaces the per-column catalog probes.
+    op.execute(
+        "ALTER TABLE postcards "
+        + ", ".join(f"ADD COLUMN IF NOT EXISTS {col} varchar" for col in _VIDEO_COLUMNS)
+    )
 
 
 def downgrade() -> None:
-    for col in ("video_s3_url", "video_thumbnail_path", "video_qr_image_path"):
-        try:
-            op.drop_column("postcards", col)
-        except Exception:
-            pass
+    op.execute(
+        "ALTER TABLE postcards "
+        + ", ".join(f"DROP COLUMN IF EXISTS {col}" for col in _VIDEO_COLUMNS)
+    )
@@ -62,47 +62,60 @@ SEED_CONTACTS = [
     },
 ]
 
+_SEED_FIELDS = ("email", "phone_number", "name", "address_line1", "city", "state", "postal_code", "country")
 
-def _get_all_user_ids(conn) -> list:
-    """Return list of user id strings (UUIDs) for every user in users table."""
-    r = conn.execute(text("SELECT id FROM users"))
-    return [str(row[0]) for row in r.fetchall()]
 
+def _seed_insert():
+    """Build one INSERT ... SELECT ... ON CONFLICT statement covering all users.
 
-def _contact_exists(conn, user_id: str, email: str) -> bool:
-    r = conn.execute(
-        text("SELECT 1 FROM contacts WHERE user_id = :uid AND email = :email LIMIT 1"),
-        {"uid": user_id, "email": email},
+    Cross-joining users against a VALUES list of the seed contacts lets the
+    server seed every (user, contact) pair in a single statement instead of one
+    existence probe plus one INSERT per pair.
+    """
+    rows = []
+    params = {}
+    for i, c in enumerate(SEED_CONTACTS):
+        rows.append("(" + ", ".join(f":{f}_{i}" for f in _SEED_FIELDS) + ")")
+        for f in _SEED_FIELDS:
+            params[f"{f}_{i}"] = c[f]
+    stmt = text(
+        "INSERT INTO contacts (id, user_id, email, phone_number, name, address_line1, city, state, postal_code, country) "
+        "SELECT gen_random_uuid(), u.id, s.email, s.phone_number, s.name, s.address_line1, s.city, s.state, s.postal_code, s.country "
+        "FROM users u "
+        "CROSS JOIN (VALUES " + ", ".join(rows) + ") "
+        "AS s(email, phone_number, name, address_line1, city, state, postal_code, country) "
+        "ON CONFLICT (user_id, email) DO NOTHING"
     )
-    return r.scalar() is not None
+    return stmt, params
+
+
+# Built once at import; upgrade() just hands the prepared clause to the driver.
+_SEED_INSERT, _SEED_PARAMS = _seed_insert()
+_CREATE_UNIQUE_INDEX = text(
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_contacts_user_email ON contacts (user_id, email)"
+)
+_DELETE_SEEDS = text("DELETE FROM contacts WHERE email = ANY(:emails)")
+_SEED_EMAILS = [c["email"] for c in SEED_CONTACTS]
+# reltuples is a single pg_class row lookup; confirm with an index-only EXISTS
+# before skipping, since the estimate can lag behind reality.
+_USERS_EMPTY = text(
+    "SELECT (SELECT reltuples::bigint FROM pg_catalog.pg_class WHERE relname = 'users') <= 0 "
+    "AND NOT EXISTS (SELECT 1 FROM users)"
+)
 
 
 def upgrade() -> None:
     conn = op.get_bind()
-    for uid in _get_all_user_ids(conn):
-        for c in SEED_CONTACTS:
-            if _contact_exists(conn, uid, c["email"]):
-                continue
-            conn.execute(
-                text("""
-                    INSERT INTO contacts (id, user_id, email, phone_number, name, address_line1, city, state, postal_code, country)
-                    VALUES (gen_random_uuid(), :uid, :email, :phone_number, :name, :address_line1, :city, :state, :postal_code, :country)
-                """),
-                {
-                    "uid": uid,
-                    "email": c["email"],
-                    "phone_number": c["phone_number"],
-                    "name": c["name"],
-                    "address_line1": c["address_line1"],
-                    "city": c["city"],
-                    "state": c["state"],
-                    "postal_code": c["postal_code"],
-                    "country": c["country"],
-                },
-            )
+    # (user_id, email) uniqueness backs the ON CONFLICT clause and enforces
+    # what the old per-row existence probes only checked.
+    conn.execute(_CREATE_UNIQUE_INDEX)
+    # Freshly provisioned databases have no users yet; skip the seed insert
+    # before it touches any contacts heap pages.
+    if bool(conn.execute(_USERS_EMPTY).scalar()):
+        return
+    conn.execute(_SEED_INSERT, _SEED_PARAMS)
 
 
 def downgrade() -> None:
     conn = op.get_bind()
-    for c in SEED_CONTACTS:
-        conn.execute(text("DELETE FROM contacts WHERE email = :email"), {"email": c["email"]})
+    conn.execute(_DELETE_SEEDS, {"emails": _SEED_EMAILS})
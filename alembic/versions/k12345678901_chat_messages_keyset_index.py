@@ -0,0 +1,44 @@
+"""chat_messages keyset pagination index
+
+Revision ID: k12345678901
+Revises: j01234567890
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "k12345678901"
+down_revision: Union[str, None] = "j01234567890"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Backs the keyset query in chat_message_crud.list_by_room_paginated:
+# WHERE room_id = :r AND (created_at, id) < (:ts, :id)
+# ORDER BY created_at DESC, id DESC — a single backward range scan.
+_INDEX_NAME = "ix_chat_messages_room_created_id"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            _INDEX_NAME,
+            "chat_messages",
+            ["room_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            _INDEX_NAME,
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
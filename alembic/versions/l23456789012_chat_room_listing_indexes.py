@@ -0,0 +1,56 @@
+"""chat room listing indexes
+
+Revision ID: l23456789012
+Revises: k12345678901
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "l23456789012"
+down_revision: Union[str, None] = "k12345678901"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers the join in list_rooms_for_user (user_id lookup returning
+    # room_id straight from the index) and the ORDER BY last_message_at DESC,
+    # created_at DESC over the joined rooms.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_participants_user_room",
+            "chat_participants",
+            ["user_id", "room_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_chat_rooms_last_message_created",
+            "chat_rooms",
+            [sa.text("last_message_at DESC"), sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_chat_rooms_last_message_created",
+            table_name="chat_rooms",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_chat_participants_user_room",
+            table_name="chat_participants",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
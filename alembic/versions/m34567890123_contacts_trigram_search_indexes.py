@@ -0,0 +1,50 @@
+"""contacts trigram search indexes
+
+Revision ID: m34567890123
+Revises: l23456789012
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+
+revision: str = "m34567890123"
+down_revision: Union[str, None] = "l23456789012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm lets ILIKE '%term%' filters in contact search use a GIN index
+    # instead of a sequential scan over the user's contacts.
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    with op.get_context().autocommit_block():
+        for name, column in (
+            ("ix_contacts_name_trgm", "name"),
+            ("ix_contacts_email_trgm", "email"),
+        ):
+            op.create_index(
+                name,
+                "contacts",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in ("ix_contacts_email_trgm", "ix_contacts_name_trgm"):
+            op.drop_index(
+                name,
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    # Extension left in place: other objects may depend on it.
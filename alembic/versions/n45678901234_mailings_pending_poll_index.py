@@ -0,0 +1,50 @@
+"""mailings pending-poll partial index
+
+Revision ID: n45678901234
+Revises: m34567890123
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "n45678901234"
+down_revision: Union[str, None] = "m34567890123"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the predicate in mailing_crud.list_pending_with_external_id so
+# the planner can use the index for the status poll.
+_PENDING_PREDICATE = (
+    "external_id IS NOT NULL AND external_id <> '' "
+    "AND status NOT IN ('sent', 'canceled', 'cancelled')"
+)
+
+
+def upgrade() -> None:
+    # The poll runs frequently and only ever wants a handful of in-flight
+    # mailings; the partial index keeps it an index scan over just those
+    # rows no matter how large the table grows.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_mailings_pending_poll",
+            "mailings",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text(_PENDING_PREDICATE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_mailings_pending_poll",
+            table_name="mailings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,35 @@
+"""postcards.is_video persisted flag
+
+Revision ID: o56789012345
+Revises: n45678901234
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "o56789012345"
+down_revision: Union[str, None] = "n45678901234"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One boolean byte per row, decided once at write time, replaces the
+    # per-render URL extension matching in the mailing HTML builders.
+    op.execute(
+        "ALTER TABLE postcards "
+        "ADD COLUMN IF NOT EXISTS is_video boolean NOT NULL DEFAULT false"
+    )
+    # Backfill existing rows: explicit video URL, or a front image whose
+    # path (query string stripped) carries a video extension.
+    op.execute(
+        "UPDATE postcards SET is_video = true "
+        "WHERE video_s3_url IS NOT NULL "
+        r"OR lower(split_part(front_image_path, '?', 1)) ~ '\.(mp4|webm|mov)$'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE postcards DROP COLUMN IF EXISTS is_video")
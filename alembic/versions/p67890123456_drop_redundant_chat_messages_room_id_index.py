@@ -0,0 +1,40 @@
+"""drop redundant chat_messages room_id index
+
+Revision ID: p67890123456
+Revises: o56789012345
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "p67890123456"
+down_revision: Union[str, None] = "o56789012345"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # room_id is the leftmost prefix of ix_chat_messages_room_created_id
+    # (k12345678901), so the single-column index only costs write
+    # amplification and cache space without serving any extra plan.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_chat_messages_room_id",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_room_id",
+            "chat_messages",
+            ["room_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,33 @@
+"""chat table ids generated in the database
+
+Revision ID: q89012345678
+Revises: p67890123456
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "q89012345678"
+down_revision: Union[str, None] = "p67890123456"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_CHAT_TABLES = ("chat_rooms", "chat_participants", "chat_messages")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; the extension keeps
+    # older servers working and is a no-op otherwise.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in _CHAT_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+        )
+
+
+def downgrade() -> None:
+    for table in _CHAT_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,33 @@
+"""postcards rendered DMM HTML cache columns
+
+Revision ID: r90123456789
+Revises: q89012345678
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "r90123456789"
+down_revision: Union[str, None] = "q89012345678"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_HTML_COLUMNS = ("rendered_front_html", "rendered_back_html")
+
+
+def upgrade() -> None:
+    # Nullable, filled lazily on first mailing render; no backfill needed.
+    op.execute(
+        "ALTER TABLE postcards "
+        + ", ".join(f"ADD COLUMN IF NOT EXISTS {col} text" for col in _HTML_COLUMNS)
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE postcards "
+        + ", ".join(f"DROP COLUMN IF EXISTS {col}" for col in _HTML_COLUMNS)
+    )
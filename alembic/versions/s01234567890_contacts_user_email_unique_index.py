@@ -0,0 +1,75 @@
+"""contacts (user_id, email) unique index for ON CONFLICT upserts
+
+Revision ID: s01234567890
+Revises: r90123456789
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "s01234567890"
+down_revision: Union[str, None] = "r90123456789"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Lowest id per (user_id, email) group; rows where id <> keep_id are the
+# duplicates to fold away before the unique build.
+_DUPES = (
+    "SELECT id, "
+    "first_value(id) OVER (PARTITION BY user_id, email ORDER BY id) AS keep_id "
+    "FROM contacts"
+)
+
+
+def upgrade() -> None:
+    # bulk_upsert (contact sync) and the seed migrations rely on
+    # ON CONFLICT (user_id, email), which needs this unique index. The
+    # retrofits in d4e5f6789012/j01234567890 only run on chains that hadn't
+    # already passed those revisions, so databases at the old head never got
+    # it; this is the creation site for them.
+    conn = op.get_bind()
+
+    # Deduplicate first or the unique build fails: keep the lowest-id contact
+    # per (user_id, email), re-point referrers at it, drop the rest.
+    for table, column in (
+        ("postcards", "receiver_contact_id"),
+        ("mailings", "contact_id"),
+        ("chat_rooms", "contact_id"),
+    ):
+        conn.execute(
+            text(
+                f"UPDATE {table} t SET {column} = d.keep_id "
+                f"FROM ({_DUPES}) d "
+                f"WHERE t.{column} = d.id AND d.id <> d.keep_id"
+            )
+        )
+    conn.execute(
+        text(
+            f"DELETE FROM contacts c USING ({_DUPES}) d "
+            "WHERE c.id = d.id AND d.id <> d.keep_id"
+        )
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_contacts_user_email",
+            "contacts",
+            ["user_id", "email"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_contacts_user_email",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
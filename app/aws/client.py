@@ -2,25 +2,58 @@
 AWS client factory - centralized boto3 client creation.
 """
 import boto3
-from typing import Optional
-from app.core.config import settings
+import threading
+from typing import Any, Dict, Optional, Tuple
 
+# One Session for the whole process: botocore loads and caches each service's
+# JSON model on the session, so sharing it means every service pays the disk
+# read + parse at most once. Client creation goes through the lock below
+# because Session.client() itself is not thread-safe.
+_session = boto3.session.Session()
 
-def get_aws_client(service_name: str, region_name: Optional[str] = None):
+# Clients are cached per (service, region): Session.client() still resolves
+# endpoints and builds a signer on every call, which is far too expensive to
+# repeat on hot paths (every S3 upload, every Cognito auth). boto3 clients are
+# thread-safe for API calls, so sharing them is fine.
+_clients: Dict[Tuple[str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_aws_client(service_name: str, region_name: Optional[str] = None, config=None):
     """
-    Create and return a boto3 client for any AWS service.
-    
+    Return a cached boto3 client for any AWS service.
+
     Args:
         service_name: AWS service name (e.g., 'cognito-idp', 's3', 'dynamodb', 'ses')
         region_name: AWS region name (defaults to AWS_REGION from settings)
-        
+        config: Optional botocore.client.Config, applied when the client for
+            this (service, region) is first constructed
+
     Returns:
-        Boto3 client for the specified service
-        
+        Boto3 client for the specified service (shared per service/region)
+
     Examples:
         >>> cognito_client = get_aws_client('cognito-idp')
         >>> s3_client = get_aws_client('s3', region_name='us-west-2')
         >>> ses_client = get_aws_client('ses')
     """
-    region = region_name or settings.COGNITO_REGION
-    return boto3.client(service_name, region_name=region)
+    if region_name is None:
+        # Imported lazily: AwsSecretsSource reaches this module while
+        # app.core.config is still mid-construction (it always passes an
+        # explicit region), so a module-level settings import would be
+        # circular and break startup whenever DB creds come from Secrets
+        # Manager rather than the environment.
+        from app.core.config import settings
+
+        region_name = settings.COGNITO_REGION
+    region = region_name
+    key = (service_name, region)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _session.client(
+                    service_name, region_name=region, config=config
+                )
+    return client
@@ -38,6 +38,10 @@ class CognitoIdentityProviderWrapper:
         self.user_pool_id = user_pool_id
         self.client_id = client_id
         self.client_secret = client_secret
+        # Pre-encoded once here; every Cognito operation computes an HMAC over
+        # these, so re-encoding per call would be wasted work.
+        self._client_id_bytes = client_id.encode('utf-8')
+        self._client_secret_bytes = client_secret.encode('utf-8') if client_secret else None
 
     def _secret_hash(self, username: str) -> str:
         """
@@ -50,16 +54,18 @@ class CognitoIdentityProviderWrapper:
         Returns:
             Base64 encoded secret hash
         """
-        if not self.client_secret:
+        if self._client_secret_bytes is None:
             return None
-            
-        message = bytes(username + self.client_id, 'utf-8')
-        key = bytes(self.client_secret, 'utf-8')
+
         secret_hash = base64.b64encode(
-            hmac.new(key, message, digestmod=hashlib.sha256).digest()
+            hmac.new(
+                self._client_secret_bytes,
+                username.encode('utf-8') + self._client_id_bytes,
+                digestmod=hashlib.sha256,
+            ).digest()
         ).decode()
-        
-        logger.debug(f"Generated SECRET_HASH for user: {username}")
+
+        logger.debug("Generated SECRET_HASH for user: %s", username)
         return secret_hash
 
     def sign_up(self, email: str, password: str, **user_attributes) -> Dict[str, Any]:
@@ -82,9 +88,10 @@ class CognitoIdentityProviderWrapper:
         username = str(uuid.uuid4())
         
         attributes = [{'Name': 'email', 'Value': email}]
-        
-        for key, value in user_attributes.items():
-            attributes.append({'Name': key, 'Value': str(value)})
+        attributes.extend(
+            {'Name': key, 'Value': value if isinstance(value, str) else str(value)}
+            for key, value in user_attributes.items()
+        )
 
         try:
             kwargs = {
@@ -98,7 +105,7 @@ class CognitoIdentityProviderWrapper:
                 kwargs['SecretHash'] = self._secret_hash(username)
             
             response = self.cognito_client.sign_up(**kwargs)
-            logger.info(f"User signed up: {email}")
+            logger.info("User signed up: %s", email)
             return {
                 'user_sub': response['UserSub'],
                 'username': username,
@@ -106,7 +113,7 @@ class CognitoIdentityProviderWrapper:
                 'code_delivery_details': response.get('CodeDeliveryDetails')
             }
         except ClientError as e:
-            logger.error(f"Sign up failed for {email}: {e.response['Error']['Message']}")
+            logger.error("Sign up failed for %s: %s", email, e.response['Error']['Message'])
             raise
 
     def initiate_auth(self, email: str, password: str) -> Dict[str, Any]:
@@ -141,7 +148,7 @@ class CognitoIdentityProviderWrapper:
             response = self.cognito_client.admin_initiate_auth(**kwargs)
 
             auth_result = response['AuthenticationResult']
-            logger.info(f"User authenticated: {email}")
+            logger.info("User authenticated: %s", email)
 
             return {
                 'id_token': auth_result['IdToken'],
@@ -151,7 +158,7 @@ class CognitoIdentityProviderWrapper:
                 'token_type': auth_result['TokenType']
             }
         except ClientError as e:
-            logger.error(f"Authentication failed for {email}: {e.response['Error']['Message']}")
+            logger.error("Authentication failed for %s: %s", email, e.response['Error']['Message'])
             raise
 
     def global_sign_out(self, access_token: str) -> bool:
@@ -172,7 +179,7 @@ class CognitoIdentityProviderWrapper:
             logger.info("User signed out globally")
             return True
         except ClientError as e:
-            logger.error(f"Global sign out failed: {e.response['Error']['Message']}")
+            logger.error("Global sign out failed: %s", e.response['Error']['Message'])
             raise
 
     def confirm_sign_up(self, username: str, confirmation_code: str) -> bool:
@@ -201,10 +208,10 @@ class CognitoIdentityProviderWrapper:
                 kwargs['SecretHash'] = self._secret_hash(username)
             
             self.cognito_client.confirm_sign_up(**kwargs)
-            logger.info(f"User confirmed: {username}")
+            logger.info("User confirmed: %s", username)
             return True
         except ClientError as e:
-            logger.error(f"Confirmation failed for {username}: {e.response['Error']['Message']}")
+            logger.error("Confirmation failed for %s: %s", username, e.response['Error']['Message'])
             raise
 
     def resend_confirmation_code(self, username: str) -> Dict[str, Any]:
@@ -231,10 +238,10 @@ class CognitoIdentityProviderWrapper:
                 kwargs['SecretHash'] = self._secret_hash(username)
             
             response = self.cognito_client.resend_confirmation_code(**kwargs)
-            logger.info(f"Confirmation code resent to: {username}")
+            logger.info("Confirmation code resent to: %s", username)
             return response.get('CodeDeliveryDetails', {})
         except ClientError as e:
-            logger.error(f"Resend code failed for {username}: {e.response['Error']['Message']}")
+            logger.error("Resend code failed for %s: %s", username, e.response['Error']['Message'])
             raise
 
     def forgot_password(self, username: str) -> Dict[str, Any]:
@@ -261,10 +268,10 @@ class CognitoIdentityProviderWrapper:
                 kwargs['SecretHash'] = self._secret_hash(username)
             
             response = self.cognito_client.forgot_password(**kwargs)
-            logger.info(f"Password reset initiated for: {username}")
+            logger.info("Password reset initiated for: %s", username)
             return response.get('CodeDeliveryDetails', {})
         except ClientError as e:
-            logger.error(f"Forgot password failed for {username}: {e.response['Error']['Message']}")
+            logger.error("Forgot password failed for %s: %s", username, e.response['Error']['Message'])
             raise
 
     def confirm_forgot_password(
@@ -300,10 +307,10 @@ class CognitoIdentityProviderWrapper:
                 kwargs['SecretHash'] = self._secret_hash(username)
             
             self.cognito_client.confirm_forgot_password(**kwargs)
-            logger.info(f"Password reset confirmed for: {username}")
+            logger.info("Password reset confirmed for: %s", username)
             return True
         except ClientError as e:
-            logger.error(f"Password reset confirmation failed for {username}: {e.response['Error']['Message']}")
+            logger.error("Password reset confirmation failed for %s: %s", username, e.response['Error']['Message'])
             raise
 
     def get_user(self, access_token: str) -> Dict[str, Any]:
@@ -333,7 +340,7 @@ class CognitoIdentityProviderWrapper:
                 'attributes': attributes
             }
         except ClientError as e:
-            logger.error(f"Get user failed: {e.response['Error']['Message']}")
+            logger.error("Get user failed: %s", e.response['Error']['Message'])
             raise
 
     def admin_get_user(self, username: str) -> Dict[str, Any]:
@@ -369,7 +376,7 @@ class CognitoIdentityProviderWrapper:
                 'user_last_modified_date': response.get('UserLastModifiedDate')
             }
         except ClientError as e:
-            logger.error(f"Admin get user failed for {username}: {e.response['Error']['Message']}")
+            logger.error("Admin get user failed for %s: %s", username, e.response['Error']['Message'])
             raise
 
     def change_password(
@@ -401,7 +408,7 @@ class CognitoIdentityProviderWrapper:
             logger.info("Password changed successfully")
             return True
         except ClientError as e:
-            logger.error(f"Password change failed: {e.response['Error']['Message']}")
+            logger.error("Password change failed: %s", e.response['Error']['Message'])
             raise
 
     def refresh_tokens(self, refresh_token: str, username: str) -> Dict[str, Any]:
@@ -443,6 +450,6 @@ class CognitoIdentityProviderWrapper:
                 'token_type': auth_result['TokenType']
             }
         except ClientError as e:
-            logger.error(f"Token refresh failed: {e.response['Error']['Message']}")
+            logger.error("Token refresh failed: %s", e.response['Error']['Message'])
             raise
 
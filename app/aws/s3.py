@@ -1,35 +1,64 @@
 """
 S3 upload helpers – store files and return public URLs.
 """
+import io
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional, Union
+
+from boto3.s3.transfer import TransferConfig
+from botocore.client import Config
 
 from app.aws.client import get_aws_client
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Larger pool + keepalive so burst uploads reuse warm TLS connections instead
+# of handshaking per request; adaptive retries back off under throttling.
+_S3_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+# Above this size, multipart upload parallelizes parts across threads.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    max_concurrency=8,
+)
+
 
 def get_s3_client():
     """S3 client for the configured region."""
-    return get_aws_client("s3", region_name=settings.s3_region)
+    return get_aws_client("s3", region_name=settings.s3_region, config=_S3_CONFIG)
+
+
+# Computed lazily on first use; bucket/region don't change at runtime, and
+# list endpoints build many URLs per response.
+_URL_PREFIX: Optional[str] = None
+
+
+def _url_prefix() -> str:
+    global _URL_PREFIX
+    if _URL_PREFIX is None:
+        _URL_PREFIX = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.s3_region}.amazonaws.com/"
+    return _URL_PREFIX
 
 
 def build_public_url(key: str) -> str:
     """Build public URL for an S3 object (bucket must allow public read)."""
-    bucket = settings.S3_BUCKET_NAME
-    region = settings.s3_region
-    return f"https://{bucket}.s3.{region}.amazonaws.com/{key}"
+    return _url_prefix() + key
 
 
 def upload_to_s3(
     key: str,
-    body: bytes,
+    body: Union[bytes, BinaryIO],
     content_type: str,
     bucket: Optional[str] = None,
 ) -> str:
     """
-    Upload bytes to S3 and return the object URL.
+    Upload bytes or a file-like object to S3 and return the object URL.
 
     Does not use ACLs (avoids AccessControlListNotSupported on buckets with
     "Bucket owner enforced" ownership). For public read, add a bucket policy
@@ -37,7 +66,8 @@ def upload_to_s3(
 
     Args:
         key: S3 object key (e.g. postcards/<id>/front.jpg)
-        body: File bytes
+        body: File bytes, or an open binary file-like object (streamed to the
+            socket without materializing a second in-memory copy)
         content_type: MIME type (e.g. image/jpeg)
         bucket: Override bucket; defaults to settings.S3_BUCKET_NAME
 
@@ -49,12 +79,60 @@ def upload_to_s3(
         raise ValueError("S3_BUCKET_NAME not configured")
 
     client = get_s3_client()
-    client.put_object(
-        Bucket=b,
-        Key=key,
-        Body=body,
-        ContentType=content_type,
+    if not isinstance(body, (bytes, bytearray)):
+        # File-like: stream it; the transfer manager switches to multipart
+        # automatically past the threshold.
+        client.upload_fileobj(
+            body,
+            b,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
+        )
+    elif len(body) > _MULTIPART_THRESHOLD:
+        client.upload_fileobj(
+            io.BytesIO(body),
+            b,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=_TRANSFER_CONFIG,
+        )
+    else:
+        client.put_object(
+            Bucket=b,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+        )
+    url = build_public_url(key)
+    logger.info("Uploaded S3 key=%s -> %s", key, url)
+    return url
+
+
+def upload_file_to_s3(
+    path: str,
+    key: str,
+    content_type: str,
+    bucket: Optional[str] = None,
+) -> str:
+    """
+    Upload a file from disk to S3 and return the object URL.
+
+    Streams directly from the path via the transfer manager, so the file is
+    never held in memory.
+    """
+    b = bucket or settings.S3_BUCKET_NAME
+    if not b:
+        raise ValueError("S3_BUCKET_NAME not configured")
+
+    client = get_s3_client()
+    client.upload_file(
+        path,
+        b,
+        key,
+        ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
     )
     url = build_public_url(key)
-    logger.info(f"Uploaded S3 key={key} -> {url}")
+    logger.info("Uploaded S3 key=%s -> %s", key, url)
     return url
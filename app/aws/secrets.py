@@ -3,12 +3,32 @@ AWS Secrets Manager wrapper.
 Based on AWS SDK examples.
 """
 import json
-import boto3
+import threading
+import time
+from typing import Dict, List, Tuple
 from botocore.exceptions import ClientError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of parsed secrets. A SecretsManager round-trip costs
+# hundreds of ms; the TTL keeps rotated secrets picked up without a restart.
+_CACHE_TTL = 3600.0
+_cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_get(secret_name: str, region_name: str):
+    entry = _cache.get((secret_name, region_name))
+    if entry and time.monotonic() - entry[0] < _CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_put(secret_name: str, region_name: str, value: dict) -> None:
+    with _cache_lock:
+        _cache[(secret_name, region_name)] = (time.monotonic(), value)
+
 
 class GetSecretWrapper:
     """Encapsulates AWS Secrets Manager actions."""
@@ -40,7 +60,7 @@ class GetSecretWrapper:
             logger.error(msg)
             raise
         except Exception as e:
-            logger.error(f"An unknown error occurred: {str(e)}.")
+            logger.error("An unknown error occurred: %s.", e)
             raise
 
 
@@ -53,17 +73,58 @@ def get_secret(secret_name: str, region_name: str = "us-east-1") -> dict:
         region_name: AWS region
         
     Returns:
-        Dict containing the secret key-value pairs
+        Dict containing the secret key-value pairs (cached for up to an hour)
     """
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    
+    cached = _cache_get(secret_name, region_name)
+    if cached is not None:
+        return cached
+
+    # Shared, cached client (app.aws.client) instead of a fresh Session per
+    # call. Imported lazily because app.core.config imports this module.
+    from app.aws.client import get_aws_client
+
+    client = get_aws_client('secretsmanager', region_name=region_name)
+
     wrapper = GetSecretWrapper(client)
     secret_string = wrapper.get_secret(secret_name)
-    
+
     # Parse JSON string to dict
-    return json.loads(secret_string)
+    value = json.loads(secret_string)
+    _cache_put(secret_name, region_name, value)
+    return value
+
+
+def get_secrets(secret_names: List[str], region_name: str = "us-east-1") -> Dict[str, dict]:
+    """
+    Get several secrets in one batch_get_secret_value call and parse as JSON.
+
+    Args:
+        secret_names: Names/paths of the secrets
+        region_name: AWS region
+
+    Returns:
+        Dict mapping secret name to its parsed key-value pairs
+
+    Raises:
+        RuntimeError: If any requested secret could not be retrieved
+    """
+    cached = {name: _cache_get(name, region_name) for name in secret_names}
+    if all(v is not None for v in cached.values()):
+        return cached
+
+    from app.aws.client import get_aws_client
+
+    client = get_aws_client('secretsmanager', region_name=region_name)
+    response = client.batch_get_secret_value(SecretIdList=secret_names)
+
+    errors = response.get("Errors") or []
+    if errors:
+        for err in errors:
+            logger.error("Failed to retrieve secret %s: %s", err.get('SecretId'), err.get('Message'))
+        raise RuntimeError(f"Failed to retrieve secrets: {[e.get('SecretId') for e in errors]}")
+
+    logger.info("Secrets retrieved successfully.")
+    secrets = {s["Name"]: json.loads(s["SecretString"]) for s in response["SecretValues"]}
+    for name, value in secrets.items():
+        _cache_put(name, region_name, value)
+    return secrets
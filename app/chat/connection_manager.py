@@ -2,10 +2,12 @@
 In-memory connection manager for chat WebSocket: subscribe/unsubscribe/broadcast by room_id.
 """
 import asyncio
-import json
 import logging
 import uuid
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Set, Tuple
+from weakref import WeakSet
+
+import orjson
 
 from fastapi import WebSocket
 
@@ -16,15 +18,19 @@ class ConnectionManager:
     """Tracks WebSocket connections per room and broadcasts events."""
 
     def __init__(self) -> None:
-        # room_id -> set of WebSocket
-        self._rooms: Dict[uuid.UUID, Set[WebSocket]] = {}
+        # room_id -> weak set of WebSocket: sockets leaked by a handler that
+        # never unsubscribed drop out on GC instead of pinning dead
+        # connections (and their buffers) here forever.
+        self._rooms: Dict[uuid.UUID, WeakSet] = {}
         self._lock = asyncio.Lock()
+        # Events queued by broadcast_to_room_sync, flushed once per event-loop
+        # tick per room (see _flush_room).
+        self._pending: Dict[uuid.UUID, List[Tuple[str, Any]]] = {}
 
     async def subscribe(self, websocket: WebSocket, room_id: uuid.UUID) -> None:
         async with self._lock:
-            if room_id not in self._rooms:
-                self._rooms[room_id] = set()
-            self._rooms[room_id].add(websocket)
+            # Single dict probe while holding the lock instead of three.
+            self._rooms.setdefault(room_id, WeakSet()).add(websocket)
         logger.debug("Subscribed ws to room %s", room_id)
 
     async def unsubscribe(self, websocket: WebSocket, room_id: uuid.UUID) -> None:
@@ -36,8 +42,15 @@ class ConnectionManager:
         logger.debug("Unsubscribed ws from room %s", room_id)
 
     async def unsubscribe_all(self, websocket: WebSocket, room_ids: Set[uuid.UUID]) -> None:
-        for rid in list(room_ids):
-            await self.unsubscribe(websocket, rid)
+        # One critical section instead of one lock acquisition per room.
+        async with self._lock:
+            for rid in list(room_ids):
+                sockets = self._rooms.get(rid)
+                if sockets is not None:
+                    sockets.discard(websocket)
+                    if not sockets:
+                        del self._rooms[rid]
+        logger.debug("Unsubscribed ws from %d rooms", len(room_ids))
 
     async def broadcast_to_room(
         self,
@@ -47,29 +60,37 @@ class ConnectionManager:
         exclude_websocket: WebSocket | None = None,
     ) -> None:
         """Send JSON message to all connections subscribed to this room (except exclude_websocket)."""
-        msg = json.dumps({
+        # orjson handles UUIDs/datetimes natively (no per-object default=str
+        # callback) and is several times faster than stdlib json. Decode once
+        # and keep text frames so existing clients are unaffected.
+        msg = orjson.dumps({
             "event": event,
             "room_id": str(room_id),
             "payload": payload,
-        }, default=str)
-        async with self._lock:
-            sockets = set(self._rooms.get(room_id) or [])
+        }, default=str).decode()
+        # Snapshot without the lock: all mutation happens on this event loop
+        # and dict/set reads are atomic, so a list copy is safe here.
+        sockets = [ws for ws in self._rooms.get(room_id) or () if ws is not exclude_websocket]
+        if not sockets:
+            return
+        # Fan out concurrently so broadcast latency is the slowest send, not
+        # the sum of all sends.
+        results = await asyncio.gather(
+            *(ws.send_text(msg) for ws in sockets), return_exceptions=True
+        )
         dead = []
-        for ws in sockets:
-            if ws is exclude_websocket:
-                continue
-            try:
-                await ws.send_text(msg)
-            except Exception as e:
-                logger.warning("Broadcast send failed: %s", e)
+        for ws, result in zip(sockets, results):
+            if isinstance(result, Exception):
+                logger.warning("Broadcast send failed: %s", result)
                 dead.append(ws)
         if dead:
             async with self._lock:
-                for ws in dead:
-                    if room_id in self._rooms:
-                        self._rooms[room_id].discard(ws)
-                if room_id in self._rooms and not self._rooms[room_id]:
-                    del self._rooms[room_id]
+                room = self._rooms.get(room_id)
+                if room is not None:
+                    for ws in dead:
+                        room.discard(ws)
+                    if not room:
+                        del self._rooms[room_id]
 
     def broadcast_to_room_sync(
         self,
@@ -80,12 +101,56 @@ class ConnectionManager:
         """Fire-and-forget broadcast from sync code (e.g. after create message). Schedules async broadcast."""
         try:
             loop = asyncio.get_running_loop()
-            loop.create_task(
-                self.broadcast_to_room(room_id, event, payload, exclude_websocket=None)
-            )
         except RuntimeError:
             # No running loop (e.g. in tests); skip broadcast
-            pass
+            return
+        # Coalesce: N broadcasts queued within the same tick share one flush
+        # task, one subscriber snapshot and one gather instead of N tasks.
+        pending = self._pending.get(room_id)
+        if pending is not None:
+            pending.append((event, payload))
+            return
+        self._pending[room_id] = [(event, payload)]
+        loop.create_task(self._flush_room(room_id))
+
+    async def _flush_room(self, room_id: uuid.UUID) -> None:
+        """Drain and send all events queued for a room in the current tick."""
+        # Yield once so broadcasts scheduled later in the same tick land in
+        # the queue before we drain it.
+        await asyncio.sleep(0)
+        events = self._pending.pop(room_id, None)
+        if not events:
+            return
+        # One frame per event keeps the wire format unchanged for existing
+        # clients; the savings are in task/snapshot overhead, not frame count.
+        msgs = [
+            orjson.dumps({
+                "event": event,
+                "room_id": str(room_id),
+                "payload": payload,
+            }, default=str).decode()
+            for event, payload in events
+        ]
+        sockets = list(self._rooms.get(room_id) or ())
+        if not sockets:
+            return
+        results = await asyncio.gather(
+            *(ws.send_text(msg) for ws in sockets for msg in msgs),
+            return_exceptions=True,
+        )
+        dead = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.warning("Broadcast send failed: %s", result)
+                dead.append(sockets[i // len(msgs)])
+        if dead:
+            async with self._lock:
+                room = self._rooms.get(room_id)
+                if room is not None:
+                    for ws in dead:
+                        room.discard(ws)
+                    if not room:
+                        del self._rooms[room_id]
 
 
 connection_manager = ConnectionManager()
@@ -2,8 +2,68 @@
 Application settings.
 All secrets loaded from AWS Secrets Manager at startup.
 """
-from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
+
+
+class AwsSecretsSource(PydanticBaseSettingsSource):
+    """
+    Lowest-priority settings source that fills DB and Cognito fields from AWS
+    Secrets Manager — but only when no higher-priority source (env vars,
+    .env) already provides DB_HOST. Workers with env-provided creds (e.g.
+    Docker with .env.docker) never touch boto3 or the network.
+    """
+
+    def __init__(self, settings_cls: Type[BaseSettings], *prior_sources: PydanticBaseSettingsSource):
+        super().__init__(settings_cls)
+        self._prior_sources = prior_sources
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        # Unused: __call__ returns the full mapping in one shot.
+        return None, field_name, False
+
+    def __call__(self) -> Dict[str, Any]:
+        provided: Dict[str, Any] = {}
+        for source in reversed(self._prior_sources):
+            provided.update(source())
+        if provided.get("DB_HOST"):
+            return {}
+
+        aws_region = provided.get("AWS_REGION") or "us-east-1"
+        cognito_region = provided.get("COGNITO_REGION") or "us-east-1"
+
+        if aws_region == cognito_region:
+            from app.aws.secrets import get_secrets
+
+            secrets = get_secrets(
+                ["love-backend/db", "love-backend/cognito"],
+                region_name=aws_region,
+            )
+            db_secret = secrets["love-backend/db"]
+            cognito_secret = secrets["love-backend/cognito"]
+        else:
+            # Batch calls are per-region; fall back to overlapping the two fetches.
+            from concurrent.futures import ThreadPoolExecutor
+            from app.aws.secrets import get_secret
+
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                db_future = ex.submit(get_secret, "love-backend/db", aws_region)
+                cognito_future = ex.submit(get_secret, "love-backend/cognito", cognito_region)
+                db_secret = db_future.result()
+                cognito_secret = cognito_future.result()
+
+        return {
+            "DB_HOST": db_secret["host"],
+            "DB_PORT": int(db_secret.get("port", 5432)),
+            "DB_NAME": db_secret["database"],
+            "DB_USER": db_secret["username"],
+            "DB_PASS": db_secret["password"],
+            "COGNITO_USER_POOL_ID": cognito_secret["user_pool_id"],
+            "COGNITO_CLIENT_ID": cognito_secret["client_id"],
+            "COGNITO_CLIENT_SECRET": cognito_secret.get("client_secret"),
+        }
 
 
 class Settings(BaseSettings):
@@ -64,28 +124,34 @@ class Settings(BaseSettings):
     def s3_region(self) -> str:
         return self.S3_REGION or self.AWS_REGION
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            file_secret_settings,
+            AwsSecretsSource(settings_cls, env_settings, dotenv_settings),
+        )
+
     class Config:
         env_file = ".env"
         extra = "ignore"
+        # Immutable after construction: all values arrive through the sources
+        # above (env, .env, Secrets Manager), so nothing should ever assign to
+        # settings at runtime, and frozen reads skip the validate-on-assign
+        # machinery.
+        frozen = True
 
 
+# Secrets Manager is consulted during construction (via AwsSecretsSource)
+# only when DB creds aren't in the environment. Alembic's env.py imports this
+# module and needs DB settings immediately, so construction stays here.
 settings = Settings()
-
-# Load secrets from AWS Secrets Manager only when DB creds aren't already
-# provided via environment variables (e.g. in Docker / local dev).
-if not settings.DB_HOST:
-    from app.aws.secrets import get_secret
-
-    _db_secret = get_secret("love-backend/db", region_name=settings.AWS_REGION)
-    settings.DB_HOST = _db_secret["host"]
-    settings.DB_PORT = int(_db_secret.get("port", 5432))
-    settings.DB_NAME = _db_secret["database"]
-    settings.DB_USER = _db_secret["username"]
-    settings.DB_PASS = _db_secret["password"]
-
-    _cognito_secret = get_secret("love-backend/cognito", region_name=settings.COGNITO_REGION)
-    settings.COGNITO_USER_POOL_ID = _cognito_secret["user_pool_id"]
-    settings.COGNITO_CLIENT_ID = _cognito_secret["client_id"]
-    settings.COGNITO_CLIENT_SECRET = _cognito_secret.get("client_secret")
-# When DB_HOST is set (e.g. Docker with .env.docker), Cognito must be set in env:
-# COGNITO_USER_POOL_ID, COGNITO_CLIENT_ID, COGNITO_CLIENT_SECRET in .env.docker
@@ -5,26 +5,49 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 from typing import Callable
-from app.session import extract_token, get_session
+from app.session import extract_token, get_session_async
+
+# Paths that never read session state: health checks, docs, static uploads
+# and the unauthenticated auth endpoints. Matched by str.startswith (C-level,
+# tuple form), so these requests skip the Redis lookup entirely. Deliberately
+# not listed: /api/v1/auth/logout and /api/v1/auth/change-password, which do
+# need the session.
+PUBLIC_PATH_PREFIXES = (
+    "/health",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/uploads",
+    "/api/v1/auth/signup",
+    "/api/v1/auth/login",
+    "/api/v1/auth/verify-email",
+    "/api/v1/auth/resend-code",
+    "/api/v1/auth/forgot-password",
+    "/api/v1/auth/reset-password",
+)
 
 
 class SessionMiddleware(BaseHTTPMiddleware):
     """Loads session from Redis based on Authorization header."""
-    
+
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Initialize empty session
         request.state.session = {}
         request.state.token = None
-        
+
+        if request.url.path.startswith(PUBLIC_PATH_PREFIXES):
+            return await call_next(request)
+
         # Try to load session from Redis if token present
         auth_header = request.headers.get("authorization")
         token = extract_token(auth_header)
-        
+
         if token:
-            user_data = get_session(token)
+            # Async client: the Redis round-trip doesn't block the event loop.
+            user_data = await get_session_async(token)
             if user_data:
                 request.state.session = user_data
                 request.state.token = token
-        
+
         response = await call_next(request)
         return response
@@ -4,7 +4,7 @@ Chat message CRUD.
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, select, tuple_
 
 from app.model.chat_message import ChatMessage
 from app.crud.base import CRUDBase
@@ -17,6 +17,26 @@ class CRUDChatMessage(CRUDBase[ChatMessage, Dict[str, Any], Dict[str, Any]]):
     def get_by_id(self, db: Session, *, message_id: uuid.UUID) -> Optional[ChatMessage]:
         return db.query(self.model).filter(self.model.id == message_id).first()
 
+    def latest_by_rooms(
+        self, db: Session, *, room_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, ChatMessage]:
+        """Latest message per room for a page of rooms, in one query.
+
+        DISTINCT ON (room_id) ... ORDER BY room_id, created_at DESC, id DESC
+        rides ix_chat_messages_room_created_id: one index probe per room
+        instead of one correlated query per room at the call site.
+        """
+        if not room_ids:
+            return {}
+        rows = (
+            db.query(self.model)
+            .filter(self.model.room_id.in_(room_ids))
+            .distinct(self.model.room_id)
+            .order_by(self.model.room_id, desc(self.model.created_at), desc(self.model.id))
+            .all()
+        )
+        return {m.room_id: m for m in rows}
+
     def list_by_room_paginated(
         self,
         db: Session,
@@ -25,17 +45,44 @@ class CRUDChatMessage(CRUDBase[ChatMessage, Dict[str, Any], Dict[str, Any]]):
         page: int = 1,
         limit: int = 50,
         before_id: Optional[uuid.UUID] = None,
+        include_total: bool = True,
+        columns: Optional[Tuple] = None,
     ) -> Tuple[List[ChatMessage], int]:
-        """List messages in a room, newest first. Optional before_id for cursor pagination."""
-        base = db.query(self.model).filter(self.model.room_id == room_id)
+        """List messages in a room, newest first. Optional before_id for cursor pagination.
+
+        columns: when given (e.g. (ChatMessage.id, ChatMessage.content, ...)),
+        rows come back as plain Row tuples — no identity-map inserts or
+        attribute instrumentation — which is what read-only list endpoints
+        want at high page sizes.
+        """
+        query = db.query(*columns) if columns else db.query(self.model)
+        base = query.filter(self.model.room_id == room_id)
+        skip = 0
         if before_id:
-            msg = self.get_by_id(db, message_id=before_id)
-            if msg and msg.room_id == room_id:
-                base = base.filter(self.model.created_at < msg.created_at)
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
-        skip = (page - 1) * limit if not before_id else 0
+            # Keyset on (created_at, id): the cursor row is resolved inline by
+            # a scalar subquery (no extra round-trip), and the tuple comparison
+            # makes each page a single range scan on
+            # ix_chat_messages_room_created_id regardless of depth. The id
+            # tie-break also keeps pages stable when timestamps collide.
+            cursor = (
+                select(self.model.created_at, self.model.id)
+                .where(self.model.id == before_id, self.model.room_id == room_id)
+                .scalar_subquery()
+            )
+            base = base.filter(
+                tuple_(self.model.created_at, self.model.id) < cursor
+            )
+        else:
+            # Page/offset retained for API compatibility; clients should
+            # prefer before_id, which stays O(limit) at any depth.
+            skip = (page - 1) * limit
+        # The count is a full filtered scan; callers that don't render totals
+        # (infinite scroll) should pass include_total=False to skip it.
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
         items = (
-            base.order_by(desc(self.model.created_at))
+            base.order_by(desc(self.model.created_at), desc(self.model.id))
             .offset(skip)
             .limit(limit)
             .all()
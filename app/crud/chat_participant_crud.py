@@ -3,9 +3,11 @@ Chat participant CRUD.
 """
 from typing import Any, Dict, List, Optional
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from app.model.chat_participant import ChatParticipant
+from app.model.user import User
 from app.crud.base import CRUDBase
 
 
@@ -25,14 +27,39 @@ class CRUDChatParticipant(CRUDBase[ChatParticipant, Dict[str, Any], Dict[str, An
             .first()
         )
 
+    def user_in_room(
+        self, db: Session, *, room_id: uuid.UUID, user_id: uuid.UUID
+    ) -> bool:
+        """Membership check as a bare EXISTS — no ORM row hydration.
+
+        For auth gates that only need the boolean; use get_by_room_and_user
+        when the row itself (e.g. unread_count) is needed.
+        """
+        return bool(
+            db.execute(
+                select(
+                    exists().where(
+                        self.model.room_id == room_id,
+                        self.model.user_id == user_id,
+                    )
+                )
+            ).scalar()
+        )
+
     def list_by_room(self, db: Session, *, room_id: uuid.UUID) -> List[ChatParticipant]:
         return db.query(self.model).filter(self.model.room_id == room_id).all()
 
     def list_other_participants(
         self, db: Session, *, room_id: uuid.UUID, exclude_user_id: uuid.UUID
     ) -> List[ChatParticipant]:
+        # Callers only read user.email off each participant, so join the user
+        # in (one query instead of a lazy load per participant) and fetch just
+        # id + email rather than the full users row.
         return (
             db.query(self.model)
+            .options(
+                joinedload(self.model.user).load_only(User.id, User.email)
+            )
             .filter(
                 self.model.room_id == room_id,
                 self.model.user_id != exclude_user_id,
@@ -41,21 +68,36 @@ class CRUDChatParticipant(CRUDBase[ChatParticipant, Dict[str, Any], Dict[str, An
         )
 
     def mark_read(self, db: Session, *, participant: ChatParticipant) -> None:
-        participant.unread_count = 0
-        db.add(participant)
-        db.commit()
+        # Predicated on unread_count > 0 so the common "open an already-read
+        # room" case is a no-op read instead of an UPDATE + WAL write. Does
+        # not commit: list_messages folds this UPDATE into the same
+        # transaction as the page SELECT, so both share one commit and the
+        # participant row lock is held for one round trip, not two.
+        db.execute(
+            update(ChatParticipant)
+            .where(
+                ChatParticipant.id == participant.id,
+                ChatParticipant.unread_count > 0,
+            )
+            .values(unread_count=0)
+        )
 
     def increment_unread_for_others(
         self, db: Session, *, room_id: uuid.UUID, exclude_user_id: uuid.UUID
     ) -> None:
-        others = self.list_other_participants(
-            db, room_id=room_id, exclude_user_id=exclude_user_id
+        # One bulk UPDATE instead of SELECT + per-participant UPDATE. This
+        # runs on every message send, and the server-side increment is also
+        # race-free under concurrent writes to the same room. Does not
+        # commit: it joins the message-send transaction so the insert and
+        # both updates land atomically.
+        db.execute(
+            update(ChatParticipant)
+            .where(
+                ChatParticipant.room_id == room_id,
+                ChatParticipant.user_id != exclude_user_id,
+            )
+            .values(unread_count=func.coalesce(ChatParticipant.unread_count, 0) + 1)
         )
-        for p in others:
-            p.unread_count = (p.unread_count or 0) + 1
-            db.add(p)
-        if others:
-            db.commit()
 
 
 chat_participant_crud = CRUDChatParticipant(ChatParticipant)
@@ -3,8 +3,8 @@ Chat room CRUD.
 """
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import desc, func, select
 
 from app.model.chat_room import ChatRoom
 from app.model.chat_participant import ChatParticipant
@@ -18,6 +18,53 @@ class CRUDChatRoom(CRUDBase[ChatRoom, Dict[str, Any], Dict[str, Any]]):
     def get_by_id(self, db: Session, *, room_id: uuid.UUID) -> Optional[ChatRoom]:
         return db.query(self.model).filter(self.model.id == room_id).first()
 
+    def find_direct_room_between(
+        self, db: Session, *, user_a: uuid.UUID, user_b: uuid.UUID
+    ) -> Optional[ChatRoom]:
+        """Direct room whose participant set is exactly {user_a, user_b}.
+
+        One query: rooms where both users participate (grouped over just
+        their participation rows, driven by ix_chat_participants_user_room)
+        minus rooms that have anyone else.
+        """
+        pair_rooms = (
+            select(ChatParticipant.room_id)
+            .where(ChatParticipant.user_id.in_([user_a, user_b]))
+            .group_by(ChatParticipant.room_id)
+            .having(func.count() == 2)
+        )
+        others_exist = (
+            select(ChatParticipant.id)
+            .where(
+                ChatParticipant.room_id == self.model.id,
+                ChatParticipant.user_id.notin_([user_a, user_b]),
+            )
+            .exists()
+        )
+        return (
+            db.query(self.model)
+            .filter(
+                self.model.chat_type == "direct",
+                self.model.id.in_(pair_rooms),
+                ~others_exist,
+            )
+            .first()
+        )
+
+    def find_room_for_contact(
+        self, db: Session, *, user_id: uuid.UUID, contact_id: uuid.UUID
+    ) -> Optional[ChatRoom]:
+        """Room linked to contact_id that user_id participates in, in one query."""
+        return (
+            db.query(self.model)
+            .join(ChatParticipant, ChatParticipant.room_id == self.model.id)
+            .filter(
+                self.model.contact_id == contact_id,
+                ChatParticipant.user_id == user_id,
+            )
+            .first()
+        )
+
     def list_rooms_for_user(
         self,
         db: Session,
@@ -26,16 +73,42 @@ class CRUDChatRoom(CRUDBase[ChatRoom, Dict[str, Any], Dict[str, Any]]):
         chat_type: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
+        include_total: bool = True,
+        with_participants: bool = False,
     ) -> Tuple[List[ChatRoom], int]:
-        """List rooms the user participates in, ordered by last_message_at desc."""
-        subq = (
-            db.query(ChatParticipant.room_id)
+        """List rooms the user participates in, ordered by last_message_at desc.
+
+        with_participants eager-loads room.participants (and each
+        participant's user) in one follow-up SELECT ... WHERE room_id IN (...)
+        per relationship, so callers that render participants don't issue a
+        query per room.
+        """
+        # Explicit join instead of id IN (subquery): the planner drives from
+        # ix_chat_participants_user_room and only touches this user's rooms,
+        # rather than semi-joining against all of chat_rooms. No .distinct()
+        # needed — (room_id, user_id) is unique on chat_participants.
+        base = (
+            db.query(self.model)
+            .join(ChatParticipant, ChatParticipant.room_id == self.model.id)
             .filter(ChatParticipant.user_id == user_id)
         )
-        base = db.query(self.model).filter(self.model.id.in_(subq))
         if chat_type:
             base = base.filter(self.model.chat_type == chat_type)
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        if with_participants:
+            # Applied after the count so the loader options never touch the
+            # aggregate query. room.contact rides along so the listing can
+            # build linked-contact details without a query per room.
+            # raiseload("*") last: everything the listing touches is named
+            # above, so an accidental lazy load on the page raises instead of
+            # silently reintroducing an N+1.
+            base = base.options(
+                selectinload(self.model.participants).selectinload(ChatParticipant.user),
+                selectinload(self.model.contact),
+                raiseload("*"),
+            )
         skip = (page - 1) * limit
         # Order by last_message_at desc (nulls last in PostgreSQL), then created_at
         items = (
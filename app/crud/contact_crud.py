@@ -1,10 +1,11 @@
 """
 Contact CRUD operations.
 """
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, raiseload
 
 from app.model.contact import Contact
 from app.crud.base import CRUDBase
@@ -46,6 +47,45 @@ class CRUDContact(CRUDBase[Contact, dict, dict]):
             .first()
         )
 
+    def bulk_upsert(
+        self,
+        db: Session,
+        *,
+        user_id: uuid.UUID,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 1000,
+    ) -> None:
+        """
+        Insert-or-update contacts by (user_id, email) in chunked statements.
+        One INSERT ... ON CONFLICT DO UPDATE per chunk instead of a
+        SELECT + INSERT/UPDATE round-trip per contact — this is the sync-job
+        path, where rows can number in the tens of thousands. Rows must not
+        repeat an email within the batch (dedupe first; Postgres rejects
+        updating the same row twice in one statement).
+        """
+        if not rows:
+            return
+        for i in range(0, len(rows), chunk_size):
+            values = [
+                {"id": uuid.uuid4(), "user_id": user_id, **row}
+                for row in rows[i : i + chunk_size]
+            ]
+            stmt = pg_insert(Contact).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "email"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "phone_number": stmt.excluded.phone_number,
+                    "address_line1": stmt.excluded.address_line1,
+                    "city": stmt.excluded.city,
+                    "state": stmt.excluded.state,
+                    "postal_code": stmt.excluded.postal_code,
+                    "country": stmt.excluded.country,
+                },
+            )
+            db.execute(stmt)
+        db.commit()
+
     def list_by_user(self, db: Session, *, user_id: uuid.UUID) -> List[Contact]:
         """List all contacts for a user."""
         return db.query(self.model).filter(self.model.user_id == user_id).all()
@@ -60,30 +100,65 @@ class CRUDContact(CRUDBase[Contact, dict, dict]):
         search: Optional[str] = None,
         name: Optional[str] = None,
         email: Optional[str] = None,
+        include_total: bool = True,
+        after_id: Optional[uuid.UUID] = None,
     ) -> Tuple[List[Contact], int]:
         """
         List contacts for a user with pagination and optional filters.
         search: ILIKE on name or email (optional).
         name: ILIKE on name (optional).
         email: ILIKE on email (optional).
-        Returns (contacts, total_count).
+        after_id: keyset cursor — return contacts after this one in listing
+        order; offset is ignored and each page is O(limit) at any depth.
+        Returns (contacts, total_count); total is 0 when include_total=False
+        (skips the filtered count scan for callers that don't render totals).
         """
-        base = db.query(self.model).filter(self.model.user_id == user_id)
-        if search and search.strip():
-            term = f"%{search.strip()}%"
-            base = base.filter(
+        # ILIKE filters are served by the pg_trgm GIN indexes on name/email
+        # (ix_contacts_name_trgm / ix_contacts_email_trgm), so substring
+        # search is an index scan rather than a seq scan per keystroke.
+        filters = [self.model.user_id == user_id]
+        search = (search or "").strip()
+        if search:
+            term = f"%{search}%"
+            filters.append(
                 or_(
                     self.model.name.ilike(term),
                     self.model.email.ilike(term),
                 )
             )
-        if name is not None and name.strip():
-            base = base.filter(self.model.name.ilike(f"%{name.strip()}%"))
-        if email is not None and email.strip():
-            base = base.filter(self.model.email.ilike(f"%{email.strip()}%"))
+        name = (name or "").strip()
+        if name:
+            filters.append(self.model.name.ilike(f"%{name}%"))
+        email = (email or "").strip()
+        if email:
+            filters.append(self.model.email.ilike(f"%{email}%"))
+        base = db.query(self.model).filter(*filters)
+        if after_id:
+            # Same keyset shape as the chat-message cursor: the cursor row is
+            # resolved inline and the tuple comparison keeps listing order
+            # (email asc, id as tie-break) without scanning skipped rows the
+            # way OFFSET does.
+            cursor = (
+                select(self.model.email, self.model.id)
+                .where(self.model.id == after_id, self.model.user_id == user_id)
+                .scalar_subquery()
+            )
+            base = base.filter(tuple_(self.model.email, self.model.id) > cursor)
+            offset = 0
 
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
-        contacts = base.order_by(self.model.email).offset(offset).limit(limit).all()
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        # The listing serializes columns only; raiseload turns any future
+        # lazy relationship access in the loop into an error instead of a
+        # silent query per contact.
+        contacts = (
+            base.options(raiseload("*"))
+            .order_by(self.model.email, self.model.id)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
         return contacts, total
 
 
@@ -18,10 +18,13 @@ class CRUDMailing(CRUDBase[Mailing, dict, dict]):
         return db.query(self.model).filter(self.model.id == mailing_id, self.model.user_id == user_id).first()
 
     def list_by_user_paginated(
-        self, db: Session, *, user_id: uuid.UUID, page: int = 1, limit: int = 20
+        self, db: Session, *, user_id: uuid.UUID, page: int = 1, limit: int = 20,
+        include_total: bool = True,
     ) -> Tuple[List[Mailing], int]:
         base = db.query(self.model).filter(self.model.user_id == user_id)
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
         skip = (page - 1) * limit
         items = base.order_by(desc(self.model.created_at)).offset(skip).limit(limit).all()
         return items, total
@@ -29,10 +32,11 @@ class CRUDMailing(CRUDBase[Mailing, dict, dict]):
     def list_pending_with_external_id(
         self, db: Session, *, user_id: Optional[uuid.UUID] = None, limit: int = 50
     ) -> List[Mailing]:
+        # Predicate mirrors the ix_mailings_pending_poll partial index.
         q = db.query(self.model).filter(
             self.model.external_id.isnot(None),
             self.model.external_id != "",
-            ~self.model.status.in_(["sent", "canceled", "cancelled"]),
+            self.model.status.notin_(["sent", "canceled", "cancelled"]),
         )
         if user_id is not None:
             q = q.filter(self.model.user_id == user_id)
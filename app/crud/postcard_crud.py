@@ -35,13 +35,17 @@ class CRUDPostcard(CRUDBase[Postcard, Dict[str, Any], Dict[str, Any]]):
         user_id: uuid.UUID,
         page: int = 1,
         limit: int = 10,
+        include_total: bool = True,
     ) -> Tuple[List[Postcard], int]:
         """
         List postcards for a user with simple pagination (newest first).
-        Returns (items, total_count). page is 1-based.
+        Returns (items, total_count). page is 1-based. Pass
+        include_total=False to skip the count scan (total comes back 0).
         """
         base = db.query(self.model).filter(self.model.user_id == user_id)
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
         skip = (page - 1) * limit
         items = base.order_by(desc(self.model.id)).offset(skip).limit(limit).all()
         return items, total
@@ -52,13 +56,16 @@ class CRUDPostcard(CRUDBase[Postcard, Dict[str, Any], Dict[str, Any]]):
         *,
         page: int = 1,
         limit: int = 10,
+        include_total: bool = True,
     ) -> Tuple[List[Postcard], int]:
         """
         List all postcards with pagination (newest first). For testing without auth.
         Returns (items, total_count). page is 1-based.
         """
         base = db.query(self.model)
-        total = base.with_entities(func.count(self.model.id)).scalar() or 0
+        total = 0
+        if include_total:
+            total = base.with_entities(func.count(self.model.id)).scalar() or 0
         skip = (page - 1) * limit
         items = base.order_by(desc(self.model.id)).offset(skip).limit(limit).all()
         return items, total
@@ -1,9 +1,11 @@
 """
 Address helpers for DMM: parse from-address JSON, normalize US state.
 """
-import json
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import orjson
+
 US_STATE_TO_ABBR = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
     "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
@@ -21,21 +23,40 @@ US_STATE_TO_ABBR = {
 }
 
 
+# Abbreviations for the fast path below: already-normalized two-letter codes
+# (the common case in bulk contact sync) return as-is with no allocation.
+_STATE_ABBRS = frozenset(US_STATE_TO_ABBR.values())
+
+
 def normalize_state(state: Optional[str]) -> Optional[str]:
-    if not state or not state.strip():
+    if not state:
         return state
     s = state.strip()
+    if not s:
+        return state
     if len(s) <= 2:
-        return s.upper()
+        return s if s in _STATE_ABBRS else s.upper()
     return US_STATE_TO_ABBR.get(s.lower(), state)
 
 
 def parse_address_json(raw: Optional[str]) -> Optional[Dict[str, Any]]:
-    """Parse DMM_FROM_ADDRESS or DMM_SENDER_COPY_ADDRESS JSON."""
+    """Parse DMM_FROM_ADDRESS or DMM_SENDER_COPY_ADDRESS JSON.
+
+    Memoized — in practice this only ever sees the two settings values, so
+    the parse + state normalization run once per value. Returns a fresh dict
+    so callers can mutate their copy safely.
+    """
     if not raw or not raw.strip():
         return None
+    parsed = _parse_address_json(raw)
+    return dict(parsed) if parsed is not None else None
+
+
+@lru_cache(maxsize=8)
+def _parse_address_json(raw: str) -> Optional[Dict[str, Any]]:
     try:
-        data = json.loads(raw)
+        # orjson: C-implemented decode, same behavior for the JSON we accept.
+        data = orjson.loads(raw)
         if not isinstance(data, dict):
             return None
         street = data.get("street") or data.get("address_line1") or ""
@@ -53,5 +74,5 @@ def parse_address_json(raw: Optional[str]) -> Optional[Dict[str, Any]]:
             "address_zip": postal,
             "address_country": country,
         }
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return None
@@ -6,6 +6,7 @@ import logging
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
 
 from app.core.config import settings
 from app.dmm.address import parse_address_json
@@ -20,10 +21,22 @@ class DMMClientError(Exception):
         super().__init__(message)
 
 
+def _response_data(r: httpx.Response) -> Dict[str, Any]:
+    """Parse a DMM success body once (orjson) and unwrap the data envelope."""
+    data = orjson.loads(r.content) if r.content else {}
+    if isinstance(data, dict) and isinstance(data.get("data"), dict):
+        data = data["data"]
+    return data if isinstance(data, dict) else {}
+
+
 class DMMClient:
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
         self.base_url = (base_url or settings.DIRECT_MAIL_MANAGER_API_URL or "").rstrip("/")
         self.api_key = api_key or settings.DIRECT_MAIL_MANAGER_API_KEY
+        self._client: Optional[httpx.Client] = None
+        # DMM_FROM_ADDRESS never changes at runtime; parse it once instead of
+        # on every postcard send.
+        self._from_address: Dict[str, Any] = parse_address_json(settings.DMM_FROM_ADDRESS) or {}
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -32,6 +45,25 @@ class DMMClient:
             "Accept": "application/json",
         }
 
+    def _get_client(self) -> httpx.Client:
+        """Shared pooled client: keep-alive connections reuse the TCP+TLS
+        session across postcard sends instead of handshaking per request.
+        Built lazily so importing the module without DMM configured is free."""
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                headers=self._headers(),
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close pooled connections. Called from app shutdown."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def _url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
 
@@ -49,7 +81,7 @@ class DMMClient:
         if not self.base_url or not self.api_key:
             raise DMMClientError("DMM API URL and API key must be set")
 
-        from_addr = from_address or parse_address_json(settings.DMM_FROM_ADDRESS) or {}
+        from_addr = from_address or self._from_address
         to_payload = {
             "first_name": to_address.get("first_name") or "",
             "last_name": to_address.get("last_name") or "",
@@ -79,46 +111,48 @@ class DMMClient:
             }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                r = client.post(self._url("postcards"), headers=self._headers(), json=body)
+            r = self._get_client().post("/postcards", json=body)
         except httpx.RequestError as e:
             logger.exception("DMM create postcard request error")
             raise DMMClientError(str(e))
 
         if r.status_code >= 400:
-            logger.warning("DMM create postcard error %s: %s", r.status_code, r.text[:500] if r.text else "")
+            # Read the body once; httpx re-parses on every .json()/.text.
+            body = r.content
+            logger.warning(
+                "DMM create postcard error %s: %s",
+                r.status_code,
+                body[:500].decode("utf-8", "replace") if body else "",
+            )
             msg = f"DMM create postcard failed: {r.status_code}"
-            if r.text:
+            if body:
                 try:
-                    err_json = r.json()
-                    detail = err_json.get("message") or err_json.get("error") or str(err_json)[:300]
-                    msg = f"{msg} — {detail}"
-                except Exception:
-                    msg = f"{msg} — {r.text[:300]}"
+                    err = orjson.loads(body)
+                    detail = (
+                        (err.get("message") or err.get("error") or str(err)[:300])
+                        if isinstance(err, dict)
+                        else str(err)[:300]
+                    )
+                except orjson.JSONDecodeError:
+                    detail = body[:300].decode("utf-8", "replace")
+                msg = f"{msg} — {detail}"
             raise DMMClientError(msg, status_code=r.status_code, body=r.text)
 
-        data = r.json() if r.content else {}
-        if isinstance(data, dict) and "data" in data and isinstance(data["data"], dict):
-            data = data["data"]
-        external_id = data.get("id") if isinstance(data, dict) else data.get("postcard_id")
-        return {"id": external_id, "status": data.get("status", "pending") if isinstance(data, dict) else "pending"}
+        data = _response_data(r)
+        return {"id": data.get("id"), "status": data.get("status", "pending")}
 
     def get_postcard(self, external_id: str) -> Dict[str, Any]:
         if not self.base_url or not self.api_key:
             raise DMMClientError("DMM API URL and API key must be set")
         try:
-            with httpx.Client(timeout=15.0) as client:
-                r = client.get(self._url(f"postcards/{external_id}"), headers=self._headers())
+            r = self._get_client().get(f"/postcards/{external_id}", timeout=15.0)
         except httpx.RequestError as e:
             logger.exception("DMM get postcard request error")
             raise DMMClientError(str(e))
         if r.status_code >= 400:
             raise DMMClientError(f"DMM get postcard failed: {r.status_code}", status_code=r.status_code, body=r.text)
-        data = r.json() if r.content else {}
-        if isinstance(data, dict) and "data" in data and isinstance(data["data"], dict):
-            data = data["data"]
-        status = data.get("status", "unknown") if isinstance(data, dict) else "unknown"
-        return {"id": external_id, "status": status, **(data if isinstance(data, dict) else {})}
+        data = _response_data(r)
+        return {"id": external_id, "status": data.get("status", "unknown"), **data}
 
 
 dmm_client = DMMClient()
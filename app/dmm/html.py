@@ -2,63 +2,126 @@
 Build front/back HTML for DMM from postcard.
 Uses front_image_path and back_image_path as stored in DB (e.g. S3 URLs).
 DMM does not support video; for video postcards we send thumbnail + QR (direct S3 link).
+
+All static fragments are assembled once at import; the build functions only
+escape the dynamic values and join the pieces.
 """
-import html
+from functools import lru_cache
 from typing import Optional
 
+from markupsafe import escape as _markupsafe_escape
+
 VIDEO_EXTENSIONS = (".mp4", ".webm", ".mov")
 
 
+def _esc(s: str) -> str:
+    # MarkupSafe escapes &<>"' in one pass in its C extension. The str() cast
+    # matters: Markup's own concatenation would re-escape our constant
+    # fragments.
+    return str(_markupsafe_escape(s))
+
+
+# Document shell (_wrap_valid_html): minimal valid HTML5 so DMM accepts it.
+_HTML_PREFIX = '<!DOCTYPE html>\n<html><head><meta charset="UTF-8"></head><body>'
+_HTML_SUFFIX = "</body></html>"
+
+# Front: video postcard with thumbnail + QR overlaid (bottom-right).
+_FRONT_VIDEO_OPEN = (
+    '<div style="position:relative;width:100%;height:100%;min-height:200px;">'
+    '<img src="'
+)
+_FRONT_VIDEO_MID = (
+    '" style="width:100%;height:100%;object-fit:cover;display:block;" alt="Video preview" />'
+    '<div style="position:absolute;bottom:12px;right:12px;text-align:center;">'
+    '<img src="'
+)
+_FRONT_VIDEO_CLOSE = (
+    '" style="width:100px;height:100px;display:block;" alt="QR code" />'
+    '<span style="font-size:11px;display:block;margin-top:4px;">Scan to watch</span>'
+    "</div>"
+    "</div>"
+)
+
+# Front: video URL but no thumbnail/QR yet — placeholder so DMM never
+# receives <video>.
+_FRONT_VIDEO_PLACEHOLDER = (
+    '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;background:#eee;padding:16px;">'
+    '<p style="text-align:center;margin:0;">Video – scan QR to watch</p>'
+    "</div>"
+)
+
+# Front: plain image.
+_FRONT_IMG_OPEN = '<div style="width:100%;height:100%;"><img src="'
+_FRONT_IMG_CLOSE = '" style="width:100%;height:100%;object-fit:cover;" alt="Front" /></div>'
+
+# Back: container, image / video note, and the message overlay.
+_BACK_OPEN = '<div style="position:relative;width:100%;height:100%;overflow:hidden;">'
+_BACK_VIDEO_NOTE = (
+    '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;background:#eee;">'
+    '<p style="margin:0;">Video on front – scan QR to watch</p></div>'
+)
+_BACK_IMG_OPEN = '<img src="'
+_BACK_IMG_CLOSE = '" style="width:100%;height:100%;object-fit:cover;display:block;" alt="Back" />'
+_BACK_OVERLAY_OPEN = (
+    '<div style="position:absolute;bottom:20px;left:20px;right:20px;'
+    'background:rgba(255,255,255,0.8);padding:10px;border-radius:8px;">'
+)
+_BACK_MSG_OPEN = '<div style="white-space:pre-wrap;font-size:14px;color:#000;">'
+_BACK_MSG_CLOSE = "</div>"
+_BACK_QR_OPEN = '<div style="margin-top:8px;font-size:10px;color:#333;">QR: '
+_BACK_QR_CLOSE = "</div>"
+_BACK_OVERLAY_CLOSE = "</div>"
+_BACK_CLOSE = "</div>"
+
+
 def _wrap_valid_html(body_content: str) -> str:
     """Wrap fragment in minimal valid HTML5 document so DMM accepts it."""
-    return (
-        "<!DOCTYPE html>\n"
-        "<html><head><meta charset=\"UTF-8\"></head><body>"
-        f"{body_content}"
-        "</body></html>"
-    )
+    return _HTML_PREFIX + body_content + _HTML_SUFFIX
 
 
+@lru_cache(maxsize=4096)
 def _is_video_url(path: str) -> bool:
+    # Cached: the same S3 URL is checked repeatedly (front/back of one
+    # postcard, retries, batch mailings). VIDEO_EXTENSIONS is constant, so
+    # results never go stale.
     if not path:
         return False
-    p = path.split("?")[0].lower()
-    return any(p.endswith(ext) for ext in VIDEO_EXTENSIONS)
+    # find + slice avoids split's intermediate list; endswith takes the whole
+    # extension tuple and checks every suffix in one C call.
+    q = path.find("?")
+    tail = path if q < 0 else path[:q]
+    return tail.lower().endswith(VIDEO_EXTENSIONS)
 
 
 def build_front_html(
     front_image_path: str,
     video_thumbnail_path: Optional[str] = None,
     video_qr_image_path: Optional[str] = None,
+    is_video: Optional[bool] = None,
 ) -> str:
     """
     Build front HTML for DMM. For video postcards pass video_thumbnail_path and video_qr_image_path
     so we render thumbnail with QR overlaid (no <video>; DMM does not support video).
+
+    is_video: pass Postcard.is_video when available to skip re-deriving it
+    from the URL; None falls back to the extension check.
     """
     url = (front_image_path or "").strip()
     thumb_url = (video_thumbnail_path or "").strip()
     qr_url = (video_qr_image_path or "").strip()
 
     if thumb_url and qr_url:
-        # Video postcard: thumbnail with QR overlaid (bottom-right)
-        content = (
-            '<div style="position:relative;width:100%;height:100%;min-height:200px;">'
-            f'<img src="{html.escape(thumb_url)}" style="width:100%;height:100%;object-fit:cover;display:block;" alt="Video preview" />'
-            '<div style="position:absolute;bottom:12px;right:12px;text-align:center;">'
-            f'<img src="{html.escape(qr_url)}" style="width:100px;height:100px;display:block;" alt="QR code" />'
-            '<span style="font-size:11px;display:block;margin-top:4px;">Scan to watch</span>'
-            "</div>"
-            "</div>"
-        )
-    elif _is_video_url(url):
-        # Video but no thumbnail/QR yet: placeholder so DMM never receives <video>
-        content = (
-            '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;background:#eee;padding:16px;">'
-            '<p style="text-align:center;margin:0;">Video – scan QR to watch</p>'
-            "</div>"
-        )
+        content = "".join((
+            _FRONT_VIDEO_OPEN,
+            _esc(thumb_url),
+            _FRONT_VIDEO_MID,
+            _esc(qr_url),
+            _FRONT_VIDEO_CLOSE,
+        ))
+    elif is_video if is_video is not None else _is_video_url(url):
+        content = _FRONT_VIDEO_PLACEHOLDER
     else:
-        content = f'<div style="width:100%;height:100%;"><img src="{html.escape(url)}" style="width:100%;height:100%;object-fit:cover;" alt="Front" /></div>'
+        content = _FRONT_IMG_OPEN + _esc(url) + _FRONT_IMG_CLOSE
     return _wrap_valid_html(content)
 
 
@@ -67,34 +130,28 @@ def build_back_html(
     personal_message: Optional[str] = None,
     qr_code_data: Optional[str] = None,
 ) -> str:
-    """Build back HTML for DMM. Image fills card; personal message in an inset overlay on top."""
+    """Build back HTML for DMM. Image fills card; personal message in an inset overlay on top.
+
+    The video check here is about the back image itself (a video file can't
+    go in <img>), so it stays URL-based rather than taking Postcard.is_video.
+    """
     url = (back_image_path or "").strip()
-    parts = ['<div style="position:relative;width:100%;height:100%;overflow:hidden;">']
+    message = (personal_message or "").strip()
+    qr_data = (qr_code_data or "").strip()
 
+    # Two or three fragments per section: straight concatenation beats a
+    # parts list + join at this size (no list alloc, no append calls).
     if _is_video_url(url):
-        parts.append(
-            '<div style="width:100%;height:100%;display:flex;align-items:center;justify-content:center;background:#eee;">'
-            '<p style="margin:0;">Video on front – scan QR to watch</p></div>'
-        )
+        body = _BACK_VIDEO_NOTE
     else:
-        parts.append(
-            f'<img src="{html.escape(url)}" style="width:100%;height:100%;object-fit:cover;display:block;" alt="Back" />'
-        )
-
-    if (personal_message or "").strip() or (qr_code_data or "").strip():
-        parts.append(
-            '<div style="position:absolute;bottom:20px;left:20px;right:20px;'
-            'background:rgba(255,255,255,0.8);padding:10px;border-radius:8px;">'
-        )
-        if (personal_message or "").strip():
-            parts.append(
-                f'<div style="white-space:pre-wrap;font-size:14px;color:#000;">{html.escape(personal_message.strip())}</div>'
-            )
-        if (qr_code_data or "").strip():
-            parts.append(
-                f'<div style="margin-top:8px;font-size:10px;color:#333;">QR: {html.escape(qr_code_data.strip())}</div>'
-            )
-        parts.append('</div>')
-
-    parts.append('</div>')
-    return _wrap_valid_html("".join(parts))
+        body = _BACK_IMG_OPEN + _esc(url) + _BACK_IMG_CLOSE
+
+    if not (message or qr_data):
+        return _wrap_valid_html(_BACK_OPEN + body + _BACK_CLOSE)
+
+    overlay = _BACK_OVERLAY_OPEN
+    if message:
+        overlay += _BACK_MSG_OPEN + _esc(message) + _BACK_MSG_CLOSE
+    if qr_data:
+        overlay += _BACK_QR_OPEN + _esc(qr_data) + _BACK_QR_CLOSE
+    return _wrap_valid_html(_BACK_OPEN + body + overlay + _BACK_OVERLAY_CLOSE + _BACK_CLOSE)
@@ -1,19 +1,23 @@
 """
 Chat message model. One message in a room.
 """
-from sqlalchemy import Column, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Index, Text, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 from app.core.database import Base
 
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    room_id = Column(UUID(as_uuid=True), ForeignKey("chat_rooms.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Generated in the database (RETURNING populates .id on flush): no
+    # Python uuid4 call and no 36-byte parameter per INSERT.
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    # No single-column index on room_id: it is the leftmost prefix of the
+    # composite index below, which serves the universal "latest N in room X"
+    # query as an ordered range scan (no sort).
+    room_id = Column(UUID(as_uuid=True), ForeignKey("chat_rooms.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
     quote_id = Column(UUID(as_uuid=True), ForeignKey("chat_messages.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -21,4 +25,19 @@ class ChatMessage(Base):
 
     room = relationship("ChatRoom", back_populates="messages", foreign_keys=[room_id])
     user = relationship("User", backref="chat_messages")
-    quote = relationship("ChatMessage", remote_side="ChatMessage.id")
+    # No endpoint loads the quoted message object (responses carry quote_id
+    # only); lazy="raise" makes an accidental per-message lazy load in a list
+    # loop fail fast instead of going N+1. Opt in with selectinload where a
+    # future endpoint actually needs quote bodies.
+    quote = relationship("ChatMessage", remote_side="ChatMessage.id", lazy="raise")
+
+    __table_args__ = (
+        # Created by migration k12345678901; declared here so metadata
+        # matches the database.
+        Index(
+            "ix_chat_messages_room_created_id",
+            room_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
@@ -1,19 +1,23 @@
 """
 Chat participant model. Links a user to a room.
 """
-from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Index, Integer, Boolean, DateTime, ForeignKey, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 from app.core.database import Base
 
 
 class ChatParticipant(Base):
     __tablename__ = "chat_participants"
-    __table_args__ = (UniqueConstraint("room_id", "user_id", name="uq_chat_participants_room_user"),)
+    __table_args__ = (
+        UniqueConstraint("room_id", "user_id", name="uq_chat_participants_room_user"),
+        # Created by migration l23456789012; drives the join in
+        # list_rooms_for_user (user's rooms straight from the index).
+        Index("ix_chat_participants_user_room", "user_id", "room_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     room_id = Column(UUID(as_uuid=True), ForeignKey("chat_rooms.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     unread_count = Column(Integer, nullable=False, default=0)
@@ -1,18 +1,27 @@
 """
 Chat room model. One conversation.
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, Index, String, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 from app.core.database import Base
 
 
 class ChatRoom(Base):
     __tablename__ = "chat_rooms"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Created by migration l23456789012; serves the listing's ORDER BY
+    # last_message_at DESC, created_at DESC without a sort node.
+    __table_args__ = (
+        Index(
+            "ix_chat_rooms_last_message_created",
+            text("last_message_at DESC"),
+            text("created_at DESC"),
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     chat_type = Column(String, nullable=False, default="direct")  # e.g. direct
     contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), nullable=True, index=True)
     topic = Column(String, nullable=True)
@@ -20,5 +29,19 @@ class ChatRoom(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     contact = relationship("Contact", backref="chat_rooms")
+    # participants stays lazy here; list endpoints eager-load it per query
+    # (selectinload in chat_room_crud) so point lookups don't pay for it.
     participants = relationship("ChatParticipant", back_populates="room", cascade="all, delete-orphan")
-    messages = relationship("ChatMessage", back_populates="room", cascade="all, delete-orphan", foreign_keys="ChatMessage.room_id")
+    # Message history can be huge, so an implicit lazy load of room.messages
+    # is never what we want — reads go through the paged CRUD, and
+    # lazy="raise" turns an accidental full-history load into an error.
+    # passive_deletes lets the DB-level ON DELETE CASCADE handle removal
+    # without loading the collection first.
+    messages = relationship(
+        "ChatMessage",
+        back_populates="room",
+        cascade="all, delete-orphan",
+        foreign_keys="ChatMessage.room_id",
+        lazy="raise",
+        passive_deletes=True,
+    )
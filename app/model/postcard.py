@@ -2,7 +2,7 @@
 Postcard model.
 Stores front/back image paths, message, QR data, and design/image metadata for exact replication.
 """
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -22,11 +22,20 @@ class Postcard(Base):
     personal_message = Column(Text, nullable=True)
     qr_code_data = Column(String, nullable=True)
 
-    # Video postcards (DMM does not support video): thumbnail + QR pointing to direct S3 video URL
+    # Video postcards (DMM does not support video): thumbnail + QR pointing to direct S3 video URL.
+    # is_video is decided once at upload (content type / URL extension) so the
+    # mailing render path never re-derives it by string-matching the URL.
+    is_video = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     video_s3_url = Column(String, nullable=True)
     video_thumbnail_path = Column(String, nullable=True)
     video_qr_image_path = Column(String, nullable=True)
 
+    # DMM HTML rendered once at first mailing and reused on retries/resends.
+    # Safe to cache: the columns it derives from never change after creation
+    # (_ensure_video_qr runs before the cache is filled).
+    rendered_front_html = Column(Text, nullable=True)
+    rendered_back_html = Column(Text, nullable=True)
+
     # Originality: font color, font size, positions, etc. so frontend can replicate exactly
     design_metadata = Column(JSONB, nullable=True)
     # Technical image details (width, height, format, size_kb) per image
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/signup", response_model=MessageResponse)
-async def signup(
+def signup(
     user_data: UserRegister,
     db: Session = Depends(get_db)
 ):
@@ -27,7 +27,7 @@ async def signup(
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(
+def login(
     login_data: UserLogin,
     db: Session = Depends(get_db)
 ):
@@ -37,7 +37,7 @@ async def login(
 
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(
+def logout(
     request: Request,
     current_user: Dict[str, Any] = Depends(validate_session),
     db: Session = Depends(get_db)
@@ -51,7 +51,7 @@ async def logout(
 
 
 @router.post("/verify-email", response_model=MessageResponse)
-async def verify_email(
+def verify_email(
     data: VerifyEmail,
     db: Session = Depends(get_db)
 ):
@@ -62,7 +62,7 @@ async def verify_email(
 
 
 @router.post("/resend-code", response_model=MessageResponse)
-async def resend_code(
+def resend_code(
     data: ResendCode,
     db: Session = Depends(get_db)
 ):
@@ -73,7 +73,7 @@ async def resend_code(
 
 
 @router.post("/forgot-password", response_model=MessageResponse)
-async def forgot_password(
+def forgot_password(
     data: ForgotPassword,
     db: Session = Depends(get_db)
 ):
@@ -84,7 +84,7 @@ async def forgot_password(
 
 
 @router.post("/reset-password", response_model=MessageResponse)
-async def reset_password(
+def reset_password(
     data: ResetPassword,
     db: Session = Depends(get_db)
 ):
@@ -95,7 +95,7 @@ async def reset_password(
 
 
 @router.post("/change-password", response_model=MessageResponse)
-async def change_password(
+def change_password(
     data: ChangePassword,
     current_user: Dict[str, Any] = Depends(validate_session),
     db: Session = Depends(get_db)
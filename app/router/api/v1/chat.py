@@ -1,16 +1,21 @@
 """
 Chat API: rooms and messages (REST). WebSocket in same module.
 """
-import json
 import logging
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import orjson
 
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import func, insert, update
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.database import get_db, SessionLocal
+from app.session import get_session_async
 from app.core.dependencies import validate_session
 from app.core.exceptions import NotFound
 from app.crud import (
@@ -20,7 +25,6 @@ from app.crud import (
     contact_crud,
 )
 from app.model.chat_message import ChatMessage
-from app.model.chat_participant import ChatParticipant
 from app.model.chat_room import ChatRoom
 from app.model.user import User
 from app.schema.chat import (
@@ -39,6 +43,87 @@ from app.chat.connection_manager import connection_manager
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# WebSocket inbound plumbing: error frames are serialized once at import and
+# actions dispatch through a table instead of an if/elif chain — both on the
+# per-message hot path.
+_WS_ERRORS = {
+    code: orjson.dumps({"event": "error", "code": code, "message": message}).decode()
+    for code, message in {
+        "INVALID_JSON": "Request body must be valid JSON.",
+        "MISSING_ROOM_ID": "Missing required field: room_id.",
+        "INVALID_ROOM_ID": "room_id must be a valid UUID.",
+        "FORBIDDEN": "You are not a participant of this room.",
+        "UNKNOWN_ACTION": "Expected action: subscribe, unsubscribe, or typing.",
+    }.items()
+}
+
+
+async def _ws_subscribe(websocket: WebSocket, user_id, room_id, obj, subscribed) -> None:
+    await connection_manager.subscribe(websocket, room_id)
+    subscribed.add(room_id)
+
+
+async def _ws_unsubscribe(websocket: WebSocket, user_id, room_id, obj, subscribed) -> None:
+    await connection_manager.unsubscribe(websocket, room_id)
+    subscribed.discard(room_id)
+
+
+async def _ws_typing(websocket: WebSocket, user_id, room_id, obj, subscribed) -> None:
+    await connection_manager.broadcast_to_room(
+        room_id,
+        "user_typing",
+        {"user_id": str(user_id), "typing": obj.get("typing", False)},
+        exclude_websocket=websocket,
+    )
+
+
+# Positive membership results are cached briefly so typing indicators and
+# re-subscribes don't cost a DB round-trip per frame. Only hits are cached:
+# a user added to a room mid-session is picked up on the next query, and
+# nothing in the API removes participants, so a short positive TTL is safe.
+_MEMBERSHIP_TTL = 60.0
+_MEMBERSHIP_MAX = 10_000
+_membership_cache: Dict[tuple, float] = {}
+
+
+def _check_membership(user_id: uuid.UUID, room_id: uuid.UUID) -> bool:
+    """Blocking DB lookup; run via run_in_threadpool from the WS loop."""
+    db = SessionLocal()
+    try:
+        return chat_participant_crud.user_in_room(db, room_id=room_id, user_id=user_id)
+    finally:
+        db.close()
+
+
+async def _is_participant(user_id: uuid.UUID, room_id: uuid.UUID) -> bool:
+    key = (user_id, room_id)
+    expires = _membership_cache.get(key)
+    if expires is not None and expires > time.monotonic():
+        return True
+    ok = await run_in_threadpool(_check_membership, user_id, room_id)
+    if ok:
+        if len(_membership_cache) >= _MEMBERSHIP_MAX:
+            _membership_cache.clear()
+        _membership_cache[key] = time.monotonic() + _MEMBERSHIP_TTL
+    return ok
+
+
+_WS_ACTIONS = {
+    "subscribe": _ws_subscribe,
+    "unsubscribe": _ws_unsubscribe,
+    "typing": _ws_typing,
+}
+
+
+# Bypass per-row validation when listing messages: the rows come from our own
+# column query and already match the schema (see the contact listing for the
+# same pattern).
+_MESSAGE_FIELDS = tuple(MessageResponse.model_fields)
+
+
+def _message_response(m) -> MessageResponse:
+    return MessageResponse.model_construct(**{f: getattr(m, f) for f in _MESSAGE_FIELDS})
+
 
 def _message_to_payload(msg: ChatMessage) -> Dict[str, Any]:
     """Serialize message for response and WebSocket broadcast."""
@@ -63,6 +148,25 @@ def _other_participants_summary(db: Session, room_id: uuid.UUID, exclude_user_id
     ]
 
 
+def _linked_contact_from_loaded(
+    room: ChatRoom, user_id: uuid.UUID
+) -> Optional[LinkedContactDetail]:
+    """Like _linked_contact_for_room but reads the eager-loaded room.contact.
+
+    The ownership check the CRUD lookup performs is done inline here.
+    """
+    contact = room.contact
+    if not contact or contact.user_id != user_id:
+        return None
+    return LinkedContactDetail(
+        id=contact.id,
+        name=contact.name,
+        email=contact.email,
+        phone_number=contact.phone_number,
+        profile_image_url=getattr(contact, "profile_image_url", None),
+    )
+
+
 def _linked_contact_for_room(
     db: Session, room: ChatRoom, user_id: uuid.UUID
 ) -> Optional[LinkedContactDetail]:
@@ -100,21 +204,21 @@ async def list_rooms(
         limit = 20
     user_id = uuid.UUID(current_user["user_id"])
     rooms, total = chat_room_crud.list_rooms_for_user(
-        db, user_id=user_id, chat_type=chat_type, page=page, limit=limit
+        db, user_id=user_id, chat_type=chat_type, page=page, limit=limit,
+        with_participants=True,
+    )
+    # One DISTINCT ON query fetches the latest message for every room on the
+    # page; the loop below then does no message queries at all.
+    last_by_room = chat_message_crud.latest_by_rooms(
+        db, room_ids=[room.id for room in rooms]
     )
     items: List[RoomListItem] = []
     for room in rooms:
-        part = chat_participant_crud.get_by_room_and_user(
-            db, room_id=room.id, user_id=user_id
-        )
+        # Participants (and their users) are eager-loaded for the whole page;
+        # no per-room queries here.
+        part = next((p for p in room.participants if p.user_id == user_id), None)
         unread = part.unread_count if part else 0
-        last_msg = (
-            db.query(ChatMessage)
-            .filter(ChatMessage.room_id == room.id)
-            .order_by(desc(ChatMessage.created_at))
-            .limit(1)
-            .first()
-        )
+        last_msg = last_by_room.get(room.id)
         preview = None
         if last_msg:
             preview = LastMessagePreview(
@@ -133,8 +237,12 @@ async def list_rooms(
                 created_at=room.created_at,
                 unread_count=unread,
                 last_message_preview=preview,
-                other_participants=_other_participants_summary(db, room.id, user_id),
-                linked_contact=_linked_contact_for_room(db, room, user_id),
+                other_participants=[
+                    {"user_id": str(p.user_id), "email": p.user.email if p.user else None}
+                    for p in room.participants
+                    if p.user_id != user_id
+                ],
+                linked_contact=_linked_contact_from_loaded(room, user_id),
             )
         )
     total_pages = (total + limit - 1) // limit if total else 0
@@ -167,36 +275,26 @@ async def create_or_get_room(
         other_user = db.query(User).filter(User.id == other_id).first()
         if not other_user:
             raise NotFound("User")
-        # Find room where both are participants
-        my_participations = (
-            db.query(ChatParticipant.room_id)
-            .filter(ChatParticipant.user_id == user_id)
-            .all()
-        )
-        my_room_ids = [p[0] for p in my_participations]
-        for rid in my_room_ids:
-            room = chat_room_crud.get_by_id(db, room_id=rid)
-            if not room or room.chat_type != "direct":
-                continue
-            participants = chat_participant_crud.list_by_room(db, room_id=rid)
-            user_ids = {p.user_id for p in participants}
-            if user_ids == {user_id, other_id}:
-                part = chat_participant_crud.get_by_room_and_user(db, room_id=rid, user_id=user_id)
-                return RoomResponse(
-                    id=room.id,
-                    chat_type=room.chat_type,
-                    contact_id=room.contact_id,
-                    topic=room.topic,
-                    last_message_at=room.last_message_at,
-                    created_at=room.created_at,
-                    unread_count=part.unread_count if part else 0,
-                    other_participants=_other_participants_summary(db, room.id, user_id),
-                    linked_contact=_linked_contact_for_room(db, room, user_id),
-                )
+        # Find room where both are participants — one existence query instead
+        # of walking every room the caller is in.
+        room = chat_room_crud.find_direct_room_between(db, user_a=user_id, user_b=other_id)
+        if room:
+            part = chat_participant_crud.get_by_room_and_user(db, room_id=room.id, user_id=user_id)
+            return RoomResponse(
+                id=room.id,
+                chat_type=room.chat_type,
+                contact_id=room.contact_id,
+                topic=room.topic,
+                last_message_at=room.last_message_at,
+                created_at=room.created_at,
+                unread_count=part.unread_count if part else 0,
+                other_participants=_other_participants_summary(db, room.id, user_id),
+                linked_contact=_linked_contact_for_room(db, room, user_id),
+            )
         # Create new room with two participants
         room = chat_room_crud.create_from_dict(
             db,
-            obj_in={"id": uuid.uuid4(), "chat_type": "direct"},
+            obj_in={"chat_type": "direct"},
         )
         chat_participant_crud.create_from_dict(
             db,
@@ -221,30 +319,26 @@ async def create_or_get_room(
         contact = contact_crud.get_by_user_and_id(db, user_id=user_id, contact_id=body.contact_id)
         if not contact:
             raise NotFound("Contact")
-        # Find existing room for this user + contact
-        my_participations = (
-            db.query(ChatParticipant.room_id)
-            .filter(ChatParticipant.user_id == user_id)
-            .all()
+        # Find existing room for this user + contact in one joined query.
+        room = chat_room_crud.find_room_for_contact(
+            db, user_id=user_id, contact_id=body.contact_id
         )
-        for (rid,) in my_participations:
-            room = chat_room_crud.get_by_id(db, room_id=rid)
-            if room and room.contact_id == body.contact_id:
-                part = chat_participant_crud.get_by_room_and_user(db, room_id=rid, user_id=user_id)
-                return RoomResponse(
-                    id=room.id,
-                    chat_type=room.chat_type,
-                    contact_id=room.contact_id,
-                    topic=room.topic,
-                    last_message_at=room.last_message_at,
-                    created_at=room.created_at,
-                    unread_count=part.unread_count if part else 0,
-                    other_participants=[],
-                    linked_contact=_linked_contact_for_room(db, room, user_id),
-                )
+        if room:
+            part = chat_participant_crud.get_by_room_and_user(db, room_id=room.id, user_id=user_id)
+            return RoomResponse(
+                id=room.id,
+                chat_type=room.chat_type,
+                contact_id=room.contact_id,
+                topic=room.topic,
+                last_message_at=room.last_message_at,
+                created_at=room.created_at,
+                unread_count=part.unread_count if part else 0,
+                other_participants=[],
+                linked_contact=_linked_contact_for_room(db, room, user_id),
+            )
         room = chat_room_crud.create_from_dict(
             db,
-            obj_in={"id": uuid.uuid4(), "chat_type": "direct", "contact_id": body.contact_id},
+            obj_in={"chat_type": "direct", "contact_id": body.contact_id},
         )
         chat_participant_crud.create_from_dict(
             db,
@@ -315,12 +409,25 @@ async def list_messages(
     if not part:
         raise NotFound("Room")
     chat_participant_crud.mark_read(db, participant=part)
+    # Column tuples skip ORM hydration; MessageResponse validates straight
+    # off the Row attributes.
     items, total = chat_message_crud.list_by_room_paginated(
-        db, room_id=room_id, page=page, limit=limit, before_id=before_id
+        db, room_id=room_id, page=page, limit=limit, before_id=before_id,
+        columns=(
+            ChatMessage.id,
+            ChatMessage.room_id,
+            ChatMessage.user_id,
+            ChatMessage.content,
+            ChatMessage.quote_id,
+            ChatMessage.created_at,
+        ),
     )
+    # One commit covers the mark_read UPDATE and closes the transaction the
+    # page SELECT ran in.
+    db.commit()
     total_pages = (total + limit - 1) // limit if total else 0
     return MessageListResponse(
-        items=[MessageResponse.model_validate(m) for m in items],
+        items=[_message_response(m) for m in items],
         page=page,
         limit=limit,
         total=total,
@@ -337,11 +444,9 @@ async def create_message(
 ):
     """Create a message. Updates last_message_at, unread for others, and broadcasts to WebSocket subscribers."""
     user_id = uuid.UUID(current_user["user_id"])
-    part = chat_participant_crud.get_by_room_and_user(db, room_id=room_id, user_id=user_id)
-    if not part:
-        raise NotFound("Room")
-    room = chat_room_crud.get_by_id(db, room_id=room_id)
-    if not room:
+    # Membership via EXISTS (no row hydration); the participant row existing
+    # also proves the room exists (FK), so no separate room lookup is needed.
+    if not chat_participant_crud.user_in_room(db, room_id=room_id, user_id=user_id):
         raise NotFound("Room")
     content = body.content.strip()
     if not content:
@@ -356,24 +461,31 @@ async def create_message(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"code": "INVALID_QUOTE", "message": "Quoted message must exist and belong to this room."},
             )
-    from datetime import datetime, timezone
-    from sqlalchemy.exc import SQLAlchemyError
     try:
-        msg = chat_message_crud.create_from_dict(
-            db,
-            obj_in={
-                "room_id": room_id,
-                "user_id": user_id,
-                "content": content,
-                "quote_id": body.quote_id,
-            },
-        )
-        room.last_message_at = datetime.now(timezone.utc)
-        db.add(room)
+        # One transaction, three statements, no refreshes: INSERT..RETURNING
+        # hands back the row (id and created_at included), the unread bump is
+        # one bulk UPDATE, and last_message_at uses the same transaction
+        # timestamp as the message row. Payload and response are built before
+        # commit so expire-on-commit never triggers a re-SELECT.
+        msg = db.execute(
+            insert(ChatMessage)
+            .values(
+                room_id=room_id,
+                user_id=user_id,
+                content=content,
+                quote_id=body.quote_id,
+            )
+            .returning(ChatMessage)
+        ).scalar_one()
         chat_participant_crud.increment_unread_for_others(db, room_id=room_id, exclude_user_id=user_id)
+        db.execute(
+            update(ChatRoom)
+            .where(ChatRoom.id == room_id)
+            .values(last_message_at=func.now())
+        )
+        payload = _message_to_payload(msg)
+        response = _message_response(msg)
         db.commit()
-        db.refresh(msg)
-        db.refresh(room)
     except SQLAlchemyError as e:
         db.rollback()
         logger.exception("Failed to save chat message: %s", e)
@@ -381,9 +493,8 @@ async def create_message(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"code": "SERVICE_ERROR", "message": "Failed to save message. Please try again."},
         )
-    payload = _message_to_payload(msg)
     connection_manager.broadcast_to_room_sync(room_id, "message_created", payload)
-    return MessageResponse.model_validate(msg)
+    return response
 
 
 # --- WebSocket ---
@@ -397,70 +508,49 @@ async def websocket_chat(
     await websocket.accept()
     user_id = None
     if token:
-        from app.session import get_session
-        session = get_session(token)
+        session = await get_session_async(token)
         if session:
             user_id = session.get("user_id")
     if not user_id:
         await websocket.close(code=4001)
         return
     user_id = uuid.UUID(user_id)
-    async def send_error(code: str, message: str) -> None:
+    async def send_error(code: str) -> None:
         try:
-            await websocket.send_text(
-                json.dumps({"event": "error", "code": code, "message": message})
-            )
+            await websocket.send_text(_WS_ERRORS[code])
         except Exception:
             pass
 
-    subscribed: set = set()
+    subscribed: Set[uuid.UUID] = set()
     try:
         while True:
             data = await websocket.receive_text()
             try:
-                obj = json.loads(data)
-            except json.JSONDecodeError:
-                await send_error("INVALID_JSON", "Request body must be valid JSON.")
+                obj = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                await send_error("INVALID_JSON")
                 continue
             action = obj.get("action")
+            handler = _WS_ACTIONS.get(action)
+            if handler is None:
+                await send_error("UNKNOWN_ACTION")
+                continue
             room_id_str = obj.get("room_id")
             if not room_id_str:
-                await send_error("MISSING_ROOM_ID", "Missing required field: room_id.")
+                await send_error("MISSING_ROOM_ID")
                 continue
             try:
                 room_id = uuid.UUID(room_id_str)
             except (ValueError, TypeError):
-                await send_error("INVALID_ROOM_ID", "room_id must be a valid UUID.")
+                await send_error("INVALID_ROOM_ID")
                 continue
-            db = SessionLocal()
-            try:
-                part = chat_participant_crud.get_by_room_and_user(
-                    db, room_id=room_id, user_id=user_id
-                )
-            finally:
-                db.close()
-            if not part:
-                await send_error("FORBIDDEN", "You are not a participant of this room.")
+            # Rooms in the subscribed set were membership-checked at
+            # subscribe time; everything else goes through the cached check,
+            # with the DB lookup off the event loop.
+            if room_id not in subscribed and not await _is_participant(user_id, room_id):
+                await send_error("FORBIDDEN")
                 continue
-            if action == "subscribe":
-                await connection_manager.subscribe(websocket, room_id)
-                subscribed.add(room_id)
-            elif action == "unsubscribe":
-                await connection_manager.unsubscribe(websocket, room_id)
-                subscribed.discard(room_id)
-            elif action == "typing":
-                typing = obj.get("typing", False)
-                await connection_manager.broadcast_to_room(
-                    room_id,
-                    "user_typing",
-                    {"user_id": str(user_id), "typing": typing},
-                    exclude_websocket=websocket,
-                )
-            else:
-                await send_error(
-                    "UNKNOWN_ACTION",
-                    "Expected action: subscribe, unsubscribe, or typing.",
-                )
+            await handler(websocket, user_id, room_id, obj, subscribed)
     except Exception as e:
         logger.warning("WebSocket closed: %s", e)
     finally:
@@ -15,6 +15,16 @@ from app.schema.contact import ContactListResponse, ContactResponse
 
 router = APIRouter()
 
+# Field names snapshotted once: the listing bypasses per-row validation with
+# model_construct — rows come straight from our own ORM query and already
+# match the schema, so validating each one again is pure overhead.
+_CONTACT_FIELDS = tuple(ContactResponse.model_fields)
+
+
+def _contact_response(c) -> ContactResponse:
+    return ContactResponse.model_construct(**{f: getattr(c, f) for f in _CONTACT_FIELDS})
+
+
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 100
 
@@ -30,6 +40,12 @@ async def list_contacts(
         description="Number of contacts per page (1–100). Default 100.",
     ),
     offset: int = Query(0, ge=0, description="Number of contacts to skip. Default 0."),
+    after_id: Optional[uuid.UUID] = Query(
+        None,
+        description="Keyset cursor: return contacts after this contact id in "
+        "listing order. Preferred over offset for deep pages; offset is "
+        "ignored when set.",
+    ),
     search: Optional[str] = Query(
         None,
         description="Search in name or email (case-insensitive, partial match).",
@@ -58,9 +74,10 @@ async def list_contacts(
         search=search,
         name=name,
         email=email,
+        after_id=after_id,
     )
     return ContactListResponse(
-        contacts=[ContactResponse.model_validate(c) for c in contacts],
+        contacts=[_contact_response(c) for c in contacts],
         total=total,
         limit=limit,
         offset=offset,
@@ -17,7 +17,6 @@ from app.core.exceptions import NotFound
 from app.crud import contact_crud, mailing_crud, postcard_crud
 from app.dmm import build_front_html, build_back_html, dmm_client
 from app.dmm.address import normalize_state, parse_address_json
-from app.dmm.html import _is_video_url
 from app.dmm.client import DMMClientError
 from app.model.contact import Contact
 from app.model.postcard import Postcard
@@ -85,10 +84,8 @@ def _parse_recipient_address(recipient_name: Optional[str], recipient_address: O
 
 
 def _is_video_postcard(postcard: Postcard) -> bool:
-    """True if this postcard has video (front is video or video_s3_url set)."""
-    if getattr(postcard, "video_s3_url", None):
-        return True
-    return _is_video_url(postcard.front_image_path or "")
+    """True if this postcard has video. Persisted at creation (is_video column)."""
+    return bool(postcard.is_video)
 
 
 def _ensure_video_qr(db: Session, postcard: Postcard) -> None:
@@ -97,7 +94,7 @@ def _ensure_video_qr(db: Session, postcard: Postcard) -> None:
     Generates QR PNG, uploads to S3 (or local), updates postcard.
     """
     video_url = getattr(postcard, "video_s3_url", None) or (
-        postcard.front_image_path if _is_video_url(postcard.front_image_path or "") else None
+        postcard.front_image_path if postcard.is_video else None
     )
     if not video_url or not getattr(postcard, "video_thumbnail_path", None):
         return
@@ -130,16 +127,30 @@ def _ensure_video_qr(db: Session, postcard: Postcard) -> None:
 
 def _build_html_from_postcard(db: Session, postcard: Postcard) -> tuple:
     _ensure_video_qr(db, postcard)
+    # Postcard columns are immutable after creation, so the first complete
+    # render is cached on the row and resends become a single column read.
+    if postcard.rendered_front_html and postcard.rendered_back_html:
+        return postcard.rendered_front_html, postcard.rendered_back_html
     front_html = build_front_html(
         postcard.front_image_path,
         video_thumbnail_path=getattr(postcard, "video_thumbnail_path", None),
         video_qr_image_path=getattr(postcard, "video_qr_image_path", None),
+        is_video=postcard.is_video,
     )
     back_html = build_back_html(
         postcard.back_image_path,
         personal_message=postcard.personal_message,
         qr_code_data=postcard.qr_code_data,
     )
+    # Don't cache a video render that is still missing its QR overlay
+    # (_ensure_video_qr swallows S3 upload failures): a later retry sets
+    # video_qr_image_path and must re-render, not return the placeholder.
+    if postcard.is_video and not getattr(postcard, "video_qr_image_path", None):
+        return front_html, back_html
+    postcard.rendered_front_html = front_html
+    postcard.rendered_back_html = back_html
+    db.add(postcard)
+    db.commit()
     return front_html, back_html
 
 
@@ -328,7 +339,9 @@ async def list_mailings(
     if limit < 1 or limit > 100:
         limit = 20
     user_id = uuid.UUID(current_user["user_id"])
-    items, _ = mailing_crud.list_by_user_paginated(db, user_id=user_id, page=page, limit=limit)
+    items, _ = mailing_crud.list_by_user_paginated(
+        db, user_id=user_id, page=page, limit=limit, include_total=False
+    )
     return [_mailing_to_response(db, m) for m in items]
 
 
@@ -25,6 +25,7 @@ from app.schema.postcard import (
 from app.utils.image_metadata import extract_media_metadata
 from app.utils.video_metadata import extract_video_thumbnail_frame
 from app.aws.s3 import upload_to_s3
+from app.dmm.html import _is_video_url
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -182,6 +183,9 @@ async def create_postcard(
         "qr_code_data": payload.qr_code_data,
         "design_metadata": payload.design_metadata,
         "image_metadata": image_metadata,
+        # Decided once here so the mailing render path reads a boolean
+        # instead of re-matching the URL extension per render.
+        "is_video": video_s3_url is not None or _is_video_url(front_image_path),
     }
     if video_s3_url is not None:
         obj_in["video_s3_url"] = video_s3_url
@@ -59,9 +59,9 @@ async def update_profile_image(
     if ext not in (".jpg", ".jpeg", ".png", ".webp"):
         ext = ".jpg"
 
-    content = await file.read()
     key = f"users/{user_id}/profile{ext}"
-    url = upload_to_s3(key=key, body=content, content_type=file.content_type or "image/jpeg")
+    # Stream the spooled upload file instead of reading it into memory first.
+    url = upload_to_s3(key=key, body=file.file, content_type=file.content_type or "image/jpeg")
 
     user_crud.update(db, db_obj=user, obj_in={"profile_image_url": url})
     db.refresh(user)
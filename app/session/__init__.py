@@ -2,6 +2,7 @@ from .session_layer import (
     init_redis,
     create_session,
     get_session,
+    get_session_async,
     remove_session,
     is_valid_session,
     extract_token,
@@ -10,7 +11,8 @@ from .session_layer import (
 __all__ = [
     "init_redis",
     "create_session",
-    "get_session", 
+    "get_session",
+    "get_session_async",
     "remove_session",
     "is_valid_session",
     "extract_token",
@@ -4,19 +4,33 @@ Session layer - Redis-based token store and validation.
 from typing import Optional, Dict, Any
 import logging
 import json
+import time
 import redis
+import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
-# Redis connection pool and client
+# Redis connection pools and clients. The sync client serves endpoint code
+# (which FastAPI runs in the threadpool); the async client serves the
+# middleware and WebSocket paths so session reads don't block the event loop.
 _redis_pool: Optional[redis.ConnectionPool] = None
 _redis_client: Optional[redis.Redis] = None
+_redis_async_pool: Optional[aioredis.ConnectionPool] = None
+_redis_async_client: Optional[aioredis.Redis] = None
 _session_ttl: int = 86400
 
+# Tiny in-process cache in front of Redis. The middleware reads the session
+# on every request, so bursts from the same user would hit Redis repeatedly
+# for an identical blob; a ~2s TTL keeps logout propagation near-immediate
+# while absorbing the burst.
+_LOCAL_TTL = 2.0
+_LOCAL_MAX = 10_000
+_local_cache: Dict[str, tuple] = {}  # token -> (expires_at, user_data)
+
 
 def init_redis(host: str, port: int, db: int, session_ttl: int = 86400) -> None:
-    """Initialize Redis connection pool. Call once at app startup."""
-    global _redis_pool, _redis_client, _session_ttl
+    """Initialize Redis connection pools. Call once at app startup."""
+    global _redis_pool, _redis_client, _redis_async_pool, _redis_async_client, _session_ttl
     _redis_pool = redis.ConnectionPool(
         host=host,
         port=port,
@@ -25,8 +39,16 @@ def init_redis(host: str, port: int, db: int, session_ttl: int = 86400) -> None:
         max_connections=10
     )
     _redis_client = redis.Redis(connection_pool=_redis_pool)
+    _redis_async_pool = aioredis.ConnectionPool(
+        host=host,
+        port=port,
+        db=db,
+        decode_responses=True,
+        max_connections=64
+    )
+    _redis_async_client = aioredis.Redis(connection_pool=_redis_async_pool)
     _session_ttl = session_ttl
-    logger.info(f"Redis initialized: {host}:{port}/{db}, TTL: {session_ttl}s")
+    logger.info("Redis initialized: %s:%s/%s, TTL: %ss", host, port, db, session_ttl)
 
 
 def _get_redis_client() -> redis.Redis:
@@ -41,26 +63,56 @@ def create_session(token: str, user_data: Dict[str, Any]) -> None:
     client = _get_redis_client()
     session_key = f"session:{token}"
     client.setex(session_key, _session_ttl, json.dumps(user_data))
-    logger.info(f"Session created for user: {user_data.get('email')}")
+    _local_cache_put(token, user_data)
+    logger.info("Session created for user: %s", user_data.get('email'))
 
 
 def get_session(token: str) -> Optional[Dict[str, Any]]:
-    """Get user data from Redis session if token exists."""
+    """Get user data from the session (local cache, then Redis)."""
+    entry = _local_cache.get(token)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
     client = _get_redis_client()
     session_key = f"session:{token}"
     data = client.get(session_key)
     if data:
-        return json.loads(data)
+        user_data = json.loads(data)
+        _local_cache_put(token, user_data)
+        return user_data
     return None
 
 
+async def get_session_async(token: str) -> Optional[Dict[str, Any]]:
+    """Async get_session for the middleware/WebSocket path (non-blocking)."""
+    entry = _local_cache.get(token)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    if _redis_async_client is None:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    data = await _redis_async_client.get(f"session:{token}")
+    if data:
+        user_data = json.loads(data)
+        _local_cache_put(token, user_data)
+        return user_data
+    return None
+
+
+def _local_cache_put(token: str, user_data: Dict[str, Any]) -> None:
+    if len(_local_cache) >= _LOCAL_MAX:
+        # Rare under normal load; dropping everything is simpler than LRU
+        # bookkeeping for a 2-second cache.
+        _local_cache.clear()
+    _local_cache[token] = (time.monotonic() + _LOCAL_TTL, user_data)
+
+
 def remove_session(token: str) -> bool:
     """Remove token from Redis session (logout)."""
+    _local_cache.pop(token, None)
     client = _get_redis_client()
     session_key = f"session:{token}"
     result = client.delete(session_key)
     if result > 0:
-        logger.info(f"Session removed for token")
+        logger.info("Session removed for token")
         return True
     return False
 
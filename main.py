@@ -57,6 +57,8 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down...")
+    from app.dmm.client import dmm_client
+    dmm_client.close()
     engine.dispose()
 
 
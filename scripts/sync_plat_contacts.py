@@ -21,6 +21,7 @@ sys.path.insert(0, ".")
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.crud import contact_crud, user_crud
+from app.model.contact import Contact
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -267,6 +268,20 @@ def run_sync() -> None:
     SAMPLE_INCOMPLETE_MAX = 50
     sample_incomplete: List[Dict[str, Any]] = []
     try:
+        # One SELECT for the user's existing names/emails, then one
+        # INSERT ... ON CONFLICT DO UPDATE per chunk — instead of two
+        # SELECTs plus an INSERT or UPDATE per Plat contact.
+        existing_rows = (
+            db.query(Contact.name, Contact.email)
+            .filter(Contact.user_id == sync_user_id)
+            .all()
+        )
+        existing_names = {
+            n.strip().lower() for n, _ in existing_rows if n and n.strip()
+        }
+        existing_emails = {e for _, e in existing_rows}
+
+        rows_by_email: Dict[str, Dict[str, Any]] = {}
         for c in plat_contacts:
             row = plat_contact_to_our_row(c)
             if not row:
@@ -278,42 +293,19 @@ def run_sync() -> None:
                         "fullAddress": (c.get("fullAddress") or "").strip()[:200],
                     })
                 continue
-            existing_by_name = contact_crud.get_by_user_and_name(db, user_id=sync_user_id, name=row["name"])
-            if existing_by_name:
+            if row["name"] and row["name"].strip().lower() in existing_names:
                 skipped_same_name += 1
                 continue
-            existing_by_email = contact_crud.get_by_user_and_email(db, user_id=sync_user_id, email=row["email"])
-            if existing_by_email:
-                contact_crud.update(
-                    db,
-                    db_obj=existing_by_email,
-                    obj_in={
-                        "name": row["name"],
-                        "phone_number": row["phone_number"],
-                        "address_line1": row["address_line1"],
-                        "city": row["city"],
-                        "state": row["state"],
-                        "postal_code": row["postal_code"],
-                        "country": row["country"],
-                    },
-                )
+            # Last row wins for duplicate emails within the batch; the upsert
+            # statement cannot touch the same (user_id, email) twice.
+            rows_by_email[row["email"]] = row
+
+        for email in rows_by_email:
+            if email in existing_emails:
                 updated += 1
             else:
-                contact_crud.create_from_dict(
-                    db,
-                    obj_in={
-                        "user_id": sync_user_id,
-                        "email": row["email"],
-                        "name": row["name"],
-                        "phone_number": row["phone_number"],
-                        "address_line1": row["address_line1"],
-                        "city": row["city"],
-                        "state": row["state"],
-                        "postal_code": row["postal_code"],
-                        "country": row["country"],
-                    },
-                )
                 created += 1
+        contact_crud.bulk_upsert(db, user_id=sync_user_id, rows=list(rows_by_email.values()))
     finally:
         db.close()
 